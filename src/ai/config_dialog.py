@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import json
+import queue
+import threading
 import tkinter as tk
+from concurrent.futures import Future
+from http.client import HTTPConnection, HTTPSConnection
 from tkinter import messagebox, ttk
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+from urllib.parse import urlparse
 
 if TYPE_CHECKING:
     from src.core.pet_core import DesktopPet
 
-from src.config import load_config, update_config
+from src.config import get_config_snapshot, get_config_version, update_config
 from src.constants import (
     AI_DEFAULT_BASE_URLS,
     AI_DEFAULT_MODELS,
@@ -25,6 +31,74 @@ from src.constants import (
     AI_PROVIDER_NAMES,
 )
 
+# 配置项字段表：(配置键, 界面变量名, 变量类型, 默认值)
+_FIELDS = (
+    ("ai_enabled", "enabled", tk.BooleanVar, False),
+    ("ai_provider", "provider", tk.StringVar, AI_PROVIDER_DEEPSEEK),
+    ("ai_api_key", "api_key", tk.StringVar, ""),
+    ("ai_model", "model", tk.StringVar, AI_DEFAULT_MODELS[AI_PROVIDER_DEEPSEEK]),
+    ("ai_base_url", "base_url", tk.StringVar, ""),
+    ("ai_personality", "personality", tk.StringVar, "aemeath"),
+)
+
+# 对话框尺寸
+_DIALOG_WIDTH = 520
+_DIALOG_HEIGHT = 500
+
+# 性格说明
+_PERSONALITY_DESC = {
+    "aemeath": "爱弥斯（Aemeath）- 鸣潮角色，粉色头发电子幽灵少女",
+    "default": "活泼友善，带可爱语气",
+    "helpful": "专业准确，实用建议",
+    "cute": "超级可爱，喜欢颜文字",
+    "tsundere": "傲娇属性，外冷内热",
+}
+
+# 下拉框候选值（模块加载时生成一次，打开/切换时直接复用）
+_PERSONALITY_VALUES = tuple(_PERSONALITY_DESC)
+_PROVIDER_MODEL_VALUES = {
+    provider: tuple(models) for provider, models in AI_MODELS.items()
+}
+
+# 各服务商 API 密钥的固定前缀（未列出的服务商不校验前缀）
+_PROVIDER_KEY_PREFIX = {
+    AI_PROVIDER_DEEPSEEK: "sk-",
+    AI_PROVIDER_OPENAI: "sk-",
+    AI_PROVIDER_QWEN: "sk-",
+    AI_PROVIDER_KIMI: "sk-",
+}
+
+
+def _looks_like_valid_key(provider: str, api_key: str) -> bool:
+    """本地粗略校验API密钥格式，避免明显无效的密钥发起网络请求"""
+    if any(ch.isspace() for ch in api_key):
+        return False
+    prefix = _PROVIDER_KEY_PREFIX.get(provider)
+    if prefix is None:
+        return True
+    return api_key.startswith(prefix) and len(api_key) > len(prefix)
+
+
+def _looks_like_valid_url(base_url: str) -> bool:
+    """校验Base URL是否包含 http(s) 协议和主机名"""
+    parsed = urlparse(base_url)
+    return parsed.scheme in ("http", "https") and bool(parsed.netloc)
+
+
+def _default_headers(api_key: str) -> dict[str, str]:
+    """OpenAI 兼容接口的通用请求头（Kimi、千问等均适用）"""
+    return {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}",
+    }
+
+
+# 主线程轮询连接测试结果的间隔（毫秒）
+_TEST_POLL_MS = 50
+
+# 需要特殊请求头的服务商在此注册构造函数，其余使用 _default_headers
+_HEADER_BUILDERS: dict[str, Callable[[str], dict[str, str]]] = {}
+
 
 class AIConfigDialog:
     """AI配置对话框"""
@@ -33,42 +107,111 @@ class AIConfigDialog:
         self.app = app
         self.dialog: tk.Toplevel | None = None
         self.config_vars: dict = {}
+        # 界面组件只在首次 show() 时构建，之后隐藏/重新显示复用
+        self._widgets_built = False
+        # 当前模型下拉框中的模型名称集合，用于 O(1) 去重
+        self._model_set: set[str] = set()
+        # 连接测试：常驻守护工作线程与任务队列（首次测试时启动线程）
+        self._test_thread: threading.Thread | None = None
+        self._test_jobs: queue.SimpleQueue = queue.SimpleQueue()
+        # 工作线程只写入 Future，主线程通过 after 轮询结果
+        self._test_future: Future | None = None
+        self._test_poll_id: str | None = None
+        self._test_progress: ttk.Progressbar | None = None
+        self._test_button: ttk.Button | None = None
+        # 当前测试的取消信号
+        self._test_cancel: threading.Event | None = None
+        # 按 (协议, 主机) 复用的 HTTP 连接，重复测试时保持长连接（仅工作线程访问）
+        self._test_conn: HTTPConnection | None = None
+        self._test_conn_key: tuple[str, str] | None = None
+        # 界面变量对应的配置版本号（-1 表示界面可能有未保存的修改）
+        self._config_version = -1
 
     def show(self) -> None:
         """显示配置对话框"""
-        if self.dialog and self.dialog.winfo_exists():
+        if self._widgets_built and self.dialog and self.dialog.winfo_exists():
+            if self.dialog.state() == "withdrawn":
+                # 复用已构建的界面，配置有变化时才刷新变量值
+                if self._config_version != get_config_version():
+                    self._refresh_values(get_config_snapshot())
+                self.dialog.deiconify()
+                self.dialog.grab_set()
+                self._flash_topmost()
             self.dialog.lift()
             return
 
         self._create_dialog()
 
+    def hide(self) -> None:
+        """隐藏配置对话框（保留界面以便下次快速显示）"""
+        if not self.dialog or not self.dialog.winfo_exists():
+            return
+        self._cancel_test()
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        # 未经保存关闭时界面可能残留修改，下次显示需重新刷新
+        self._config_version = -1
+
+    def destroy(self) -> None:
+        """退出程序时取消测试、结束工作线程并销毁对话框"""
+        self._cancel_test()
+        if self._test_thread is not None:
+            self._test_jobs.put(None)
+            self._test_thread = None
+        if self.dialog is not None and self.dialog.winfo_exists():
+            self.dialog.destroy()
+        self.dialog = None
+
+    def _flash_topmost(self) -> None:
+        """窗口置顶（短暂显示后取消，让其他窗口可以覆盖）"""
+        self.dialog.attributes("-topmost", True)
+        self.dialog.after(2000, self._on_topmost_timeout)
+
+    def _refresh_values(self, config: Mapping[str, Any]) -> None:
+        """用当前配置刷新已有的界面变量"""
+        self._config_version = get_config_version()
+        config_vars = self.config_vars
+        for cfg_key, ui_key, _, default in _FIELDS:
+            config_vars[ui_key].set(config.get(cfg_key, default))
+
+        self.show_key_var.set(False)
+        self._toggle_key_visibility()
+        self._on_personality_change()
+        self._on_provider_change()
+
     def _create_dialog(self) -> None:
         """创建对话框"""
         self.dialog = tk.Toplevel(self.app.root)
         self.dialog.title("AI助手配置")
-        self.dialog.geometry("520x680")
+        self.dialog.geometry(f"{_DIALOG_WIDTH}x{_DIALOG_HEIGHT}")
         self.dialog.resizable(False, False)
         self.dialog.transient(self.app.root)
         self.dialog.grab_set()
+        self.dialog.protocol("WM_DELETE_WINDOW", self.hide)
 
-        # 窗口置顶（短暂显示后取消，让其他窗口可以覆盖）
-        self.dialog.attributes("-topmost", True)
-        self.dialog.after(2000, lambda: self.dialog.attributes("-topmost", False))
-
-        # 居中显示
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() - 520) // 2
-        y = (self.dialog.winfo_screenheight() - 680) // 2
-        self.dialog.geometry(f"+{x}+{y}")
+        self._flash_topmost()
 
         # 设置主题样式
         self._setup_style()
 
-        # 加载当前配置
-        config = load_config()
+        # 读取配置快照（缓存命中时无需读盘）
+        config = get_config_snapshot()
+        self._config_version = get_config_version()
 
         # 创建界面
         self._create_widgets(config)
+        self._widgets_built = True
+
+        # 构建完成后再居中，避免构建途中强制布局
+        self.dialog.after_idle(self._center_dialog)
+
+    def _center_dialog(self) -> None:
+        """将对话框居中显示"""
+        if not self.dialog or not self.dialog.winfo_exists():
+            return
+        x = (self.dialog.winfo_screenwidth() - _DIALOG_WIDTH) // 2
+        y = (self.dialog.winfo_screenheight() - _DIALOG_HEIGHT) // 2
+        self.dialog.geometry(f"{_DIALOG_WIDTH}x{_DIALOG_HEIGHT}+{x}+{y}")
 
     def _setup_style(self) -> None:
         """设置主题样式"""
@@ -92,26 +235,50 @@ class AIConfigDialog:
             foreground="white",
             borderwidth=0,
             focuscolor="none",
+            font=("Microsoft YaHei", 10),
+            padding=(20, 6),
         )
         style.map(
             "Primary.TButton",
             background=[("active", "#FF85C1"), ("pressed", "#E85A9C")],
         )
 
+        style.configure(
+            "Accent.TButton",
+            background="#4ECDC4",
+            foreground="white",
+            borderwidth=0,
+            focuscolor="none",
+            font=("Microsoft YaHei", 10),
+            padding=(20, 6),
+        )
+        style.map(
+            "Accent.TButton",
+            background=[("active", "#6ED8D0"), ("pressed", "#3DB8B0")],
+        )
+
         style.configure(
             "Secondary.TButton",
             background="#F0F0F0",
             foreground="#5C3B4A",
             borderwidth=1,
             focuscolor="none",
+            font=("Microsoft YaHei", 10),
+            padding=(20, 6),
         )
         style.map(
             "Secondary.TButton",
             background=[("active", "#E0E0E0")],
         )
 
-    def _create_widgets(self, config: dict) -> None:
+    def _create_widgets(self, config: Mapping[str, Any]) -> None:
         """创建界面组件"""
+        # 按字段表创建界面变量
+        self.config_vars = {
+            ui_key: var_cls(value=config.get(cfg_key, default))
+            for cfg_key, ui_key, var_cls, default in _FIELDS
+        }
+
         # 主容器
         main_container = ttk.Frame(self.dialog, padding=0)
         main_container.pack(fill=tk.BOTH, expand=True)
@@ -130,42 +297,17 @@ class AIConfigDialog:
         )
         title_label.pack(side=tk.LEFT, padx=20, pady=10)
 
-        # 上方可滚动区域
-        scroll_container = ttk.Frame(main_container)
-        scroll_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
-
-        # Canvas和滚动条
-        canvas = tk.Canvas(
-            scroll_container,
-            highlightthickness=0,
-            bg="#FFF5F8",
-            height=500,
-        )
-        scrollbar = ttk.Scrollbar(
-            scroll_container, orient="vertical", command=canvas.yview
-        )
-        content_frame = ttk.Frame(canvas, padding="0")
-        content_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=content_frame, anchor="nw", width=460)
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # 绑定鼠标滚轮
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-        canvas.bind("<MouseWheel>", _on_mousewheel)
-        content_frame.bind("<MouseWheel>", _on_mousewheel)
+        # 分页区域（服务商 / 模型 / 性格），由 Notebook 一次性布局
+        notebook = ttk.Notebook(main_container)
 
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        content_frame = ttk.Frame(notebook, padding=15)
+        model_tab = ttk.Frame(notebook, padding=15)
+        personality_tab = ttk.Frame(notebook, padding=15)
+        notebook.add(content_frame, text="服务商")
+        notebook.add(model_tab, text="模型")
+        notebook.add(personality_tab, text="性格")
 
         # 启用AI
-        self.config_vars["enabled"] = tk.BooleanVar(
-            value=config.get("ai_enabled", False)
-        )
         enabled_check = ttk.Checkbutton(
             content_frame,
             text="启用AI对话功能",
@@ -181,31 +323,32 @@ class AIConfigDialog:
             content_frame, text="AI服务商:", font=("Microsoft YaHei", 10, "bold")
         ).pack(anchor=tk.W, pady=(5, 5))
 
-        self.config_vars["provider"] = tk.StringVar(
-            value=config.get("ai_provider", AI_PROVIDER_DEEPSEEK)
-        )
-
         # 服务商选择按钮组
         provider_frame = tk.Frame(content_frame, bg="#FFF5F8")
         provider_frame.pack(fill=tk.X, pady=(0, 10))
 
         self.provider_buttons = {}
+        # 循环内用到的全局/属性查找提前绑定为局部变量
+        radiobutton = tk.Radiobutton
+        names_get = AI_PROVIDER_NAMES.get
+        provider_var = self.config_vars["provider"]
+        on_change = self._on_provider_change
+        provider_buttons = self.provider_buttons
         for i, provider in enumerate(AI_PROVIDERS):
-            name = AI_PROVIDER_NAMES.get(provider, provider)
-            btn = tk.Radiobutton(
+            btn = radiobutton(
                 provider_frame,
-                text=name,
-                variable=self.config_vars["provider"],
+                text=names_get(provider, provider),
+                variable=provider_var,
                 value=provider,
                 bg="#FFF5F8",
                 fg="#5C3B4A",
                 selectcolor="#FFE4EE",
                 activebackground="#FFF5F8",
                 font=("Microsoft YaHei", 9),
-                command=self._on_provider_change,
+                command=on_change,
             )
             btn.grid(row=i // 3, column=i % 3, sticky="w", padx=5, pady=3)
-            self.provider_buttons[provider] = btn
+            provider_buttons[provider] = btn
 
         # API密钥
         ttk.Label(
@@ -215,14 +358,13 @@ class AIConfigDialog:
         api_key_frame = tk.Frame(content_frame, bg="#FFF5F8")
         api_key_frame.pack(fill=tk.X, pady=(0, 8))
 
-        self.config_vars["api_key"] = tk.StringVar(value=config.get("ai_api_key", ""))
-        api_key_entry = ttk.Entry(
+        self.api_key_entry = ttk.Entry(
             api_key_frame,
             textvariable=self.config_vars["api_key"],
             show="*",
             font=("Microsoft YaHei", 9),
         )
-        api_key_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.api_key_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         # 显示/隐藏密码
         self.show_key_var = tk.BooleanVar(value=False)
@@ -234,43 +376,35 @@ class AIConfigDialog:
             fg="#5C3B4A",
             selectcolor="#FFE4EE",
             font=("Microsoft YaHei", 8),
-            command=lambda: api_key_entry.config(
-                show="" if self.show_key_var.get() else "*"
-            ),
+            command=self._toggle_key_visibility,
         )
         show_btn.pack(side=tk.RIGHT, padx=(8, 0))
 
         # 模型选择
         ttk.Label(
-            content_frame, text="模型:", font=("Microsoft YaHei", 10, "bold")
+            model_tab, text="模型:", font=("Microsoft YaHei", 10, "bold")
         ).pack(anchor=tk.W, pady=(10, 5))
 
         # 模型选择框架（带手动添加按钮）
-        model_frame = tk.Frame(content_frame, bg="#FFF5F8")
+        model_frame = tk.Frame(model_tab, bg="#FFF5F8")
         model_frame.pack(fill=tk.X, pady=(0, 5))
 
-        self.config_vars["model"] = tk.StringVar(
-            value=config.get("ai_model", AI_DEFAULT_MODELS.get(AI_PROVIDER_DEEPSEEK))
-        )
         self.model_combo = ttk.Combobox(
             model_frame,
             textvariable=self.config_vars["model"],
-            values=AI_MODELS.get(AI_PROVIDER_DEEPSEEK, []),
+            values=_PROVIDER_MODEL_VALUES.get(AI_PROVIDER_DEEPSEEK, ()),
             font=("Microsoft YaHei", 9),
         )
         self.model_combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
         self.model_combo.bind("<<ComboboxSelected>>", self._on_model_change)
 
         # 手动添加模型按钮
-        btn_add_model = tk.Button(
+        btn_add_model = ttk.Button(
             model_frame,
             text="+",
-            bg="#4ECDC4",
-            fg="white",
-            font=("Microsoft YaHei", 12, "bold"),
-            borderwidth=0,
+            style="Accent.TButton",
             width=3,
-            pady=0,
+            padding=(0, 2),
             cursor="hand2",
             command=self._add_custom_model,
         )
@@ -278,7 +412,7 @@ class AIConfigDialog:
 
         # 模型输入提示
         model_hint = tk.Label(
-            content_frame,
+            model_tab,
             text="可直接输入自定义模型名称",
             bg="#FFF5F8",
             fg="#888888",
@@ -294,7 +428,6 @@ class AIConfigDialog:
             font=("Microsoft YaHei", 10, "bold"),
         ).pack(anchor=tk.W, pady=(10, 5))
 
-        self.config_vars["base_url"] = tk.StringVar(value=config.get("ai_base_url", ""))
         self.base_url_entry = ttk.Entry(
             content_frame,
             textvariable=self.config_vars["base_url"],
@@ -315,32 +448,22 @@ class AIConfigDialog:
 
         # 性格选择
         ttk.Label(
-            content_frame, text="选择性格:", font=("Microsoft YaHei", 10, "bold")
+            personality_tab, text="选择性格:", font=("Microsoft YaHei", 10, "bold")
         ).pack(anchor=tk.W, pady=(10, 5))
 
-        self.config_vars["personality"] = tk.StringVar(
-            value=config.get("ai_personality", "aemeath")
-        )
         personality_combo = ttk.Combobox(
-            content_frame,
+            personality_tab,
             textvariable=self.config_vars["personality"],
-            values=["aemeath", "default", "helpful", "cute", "tsundere"],
+            values=_PERSONALITY_VALUES,
             state="readonly",
             font=("Microsoft YaHei", 9),
         )
         personality_combo.pack(fill=tk.X, pady=(0, 5))
 
         # 性格说明
-        personality_desc = {
-            "aemeath": "爱弥斯（Aemeath）- 鸣潮角色，粉色头发电子幽灵少女",
-            "default": "活泼友善，带可爱语气",
-            "helpful": "专业准确，实用建议",
-            "cute": "超级可爱，喜欢颜文字",
-            "tsundere": "傲娇属性，外冷内热",
-        }
         self.desc_label = tk.Label(
-            content_frame,
-            text=personality_desc.get(self.config_vars["personality"].get(), ""),
+            personality_tab,
+            text=_PERSONALITY_DESC.get(self.config_vars["personality"].get(), ""),
             bg="#FFF5F8",
             fg="#888888",
             font=("Microsoft YaHei", 9),
@@ -348,12 +471,7 @@ class AIConfigDialog:
             wraplength=450,
         )
         self.desc_label.pack(anchor=tk.W, pady=(0, 10))
-        personality_combo.bind(
-            "<<ComboboxSelected>>",
-            lambda e: self.desc_label.config(
-                text=personality_desc.get(self.config_vars["personality"].get(), "")
-            ),
-        )
+        personality_combo.bind("<<ComboboxSelected>>", self._on_personality_change)
 
         # 下方固定按钮区域
         button_frame = tk.Frame(main_container, bg="#FFF5F8", height=60)
@@ -364,71 +482,81 @@ class AIConfigDialog:
         sep = ttk.Separator(main_container, orient=tk.HORIZONTAL)
         sep.pack(fill=tk.X, side=tk.BOTTOM)
 
+        # 底部按钮区先占位，再让分页区域填满剩余空间
+        notebook.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
+
         # 按钮
-        btn_save = tk.Button(
+        btn_save = ttk.Button(
             button_frame,
             text="💾 保存配置",
-            bg="#FF69B4",
-            fg="white",
-            font=("Microsoft YaHei", 10),
-            borderwidth=0,
-            padx=20,
-            pady=8,
+            style="Primary.TButton",
             cursor="hand2",
             command=self._save_config,
         )
         btn_save.pack(side=tk.LEFT, padx=(15, 10), pady=12)
 
-        btn_test = tk.Button(
+        self._test_button = ttk.Button(
             button_frame,
             text="🔗 测试连接",
-            bg="#4ECDC4",
-            fg="white",
-            font=("Microsoft YaHei", 10),
-            borderwidth=0,
-            padx=20,
-            pady=8,
+            style="Accent.TButton",
             cursor="hand2",
             command=self._test_connection,
         )
-        btn_test.pack(side=tk.LEFT, padx=(0, 10), pady=12)
+        self._test_button.pack(side=tk.LEFT, padx=(0, 10), pady=12)
+
+        # 测试进行中显示的进度条（平时隐藏）
+        self._test_progress = ttk.Progressbar(
+            button_frame, mode="indeterminate", length=80
+        )
 
-        btn_cancel = tk.Button(
+        btn_cancel = ttk.Button(
             button_frame,
             text="✕ 取消",
-            bg="#CCCCCC",
-            fg="#5C3B4A",
-            font=("Microsoft YaHei", 10),
-            borderwidth=0,
-            padx=20,
-            pady=8,
+            style="Secondary.TButton",
             cursor="hand2",
-            command=self.dialog.destroy,
+            command=self.hide,
         )
         btn_cancel.pack(side=tk.RIGHT, padx=(0, 15), pady=12)
 
         # 初始化服务商状态
         self._on_provider_change()
 
+    def _on_topmost_timeout(self) -> None:
+        """短暂置顶结束后取消置顶"""
+        if self.dialog and self.dialog.winfo_exists():
+            self.dialog.attributes("-topmost", False)
+
+    def _toggle_key_visibility(self, event=None) -> None:
+        """切换API密钥的明文/掩码显示"""
+        self.api_key_entry.config(show="" if self.show_key_var.get() else "*")
+
+    def _on_personality_change(self, event=None) -> None:
+        """性格改变时更新说明文字"""
+        self.desc_label.config(
+            text=_PERSONALITY_DESC.get(self.config_vars["personality"].get(), "")
+        )
+
     def _on_provider_change(self, event=None) -> None:
         """服务商改变时更新默认模型和Base URL"""
         provider = self.config_vars["provider"].get()
 
-        # 更新模型列表
-        models = AI_MODELS.get(provider, [])
+        # 更新模型列表（自定义API时清空，让用户手动添加）
+        if provider == AI_PROVIDER_CUSTOM:
+            models = ()
+            default_model = ""
+        else:
+            models = _PROVIDER_MODEL_VALUES.get(provider, ())
+            default_model = AI_DEFAULT_MODELS.get(
+                provider, models[0] if models else ""
+            )
         self.model_combo["values"] = models
-        default_model = AI_DEFAULT_MODELS.get(provider, models[0] if models else "")
+        self._model_set = set(models)
         self.config_vars["model"].set(default_model)
-        self.model_combo.set(default_model)
 
         # 更新Base URL提示和模型提示
         if provider == AI_PROVIDER_CUSTOM:
             self.base_url_hint.config(text="请输入自定义API的Base URL地址")
             self.base_url_entry.config(state="normal")
-            # 自定义API时清空模型列表，让用户手动添加
-            self.model_combo["values"] = []
-            self.config_vars["model"].set("")
-            self.model_combo.set("")
         else:
             default_url = AI_DEFAULT_BASE_URLS.get(provider, "")
             self.base_url_hint.config(text=f"默认: {default_url}")
@@ -486,17 +614,16 @@ class AIConfigDialog:
         btn_frame = tk.Frame(content_frame, bg="#FFF5F8")
         btn_frame.pack(fill=tk.X)
 
-        def confirm():
+        def confirm(event=None):
             model_name = model_entry.get().strip()
             if not model_name:
                 messagebox.showwarning("提示", "请输入模型名称", parent=input_dialog)
                 return
 
             # 添加到当前模型列表
-            current_values = list(self.model_combo["values"])
-            if model_name not in current_values:
-                current_values.append(model_name)
-                self.model_combo["values"] = current_values
+            if model_name not in self._model_set:
+                self._model_set.add(model_name)
+                self.model_combo["values"] = (*self.model_combo["values"], model_name)
 
             # 选中新添加的模型
             self.config_vars["model"].set(model_name)
@@ -504,71 +631,60 @@ class AIConfigDialog:
 
             input_dialog.destroy()
 
-        tk.Button(
+        ttk.Button(
             btn_frame,
             text="✓ 添加",
-            bg="#FF69B4",
-            fg="white",
-            font=("Microsoft YaHei", 10),
-            borderwidth=0,
-            padx=20,
-            pady=5,
+            style="Primary.TButton",
             cursor="hand2",
             command=confirm,
         ).pack(side=tk.LEFT, padx=(0, 10))
 
-        tk.Button(
+        ttk.Button(
             btn_frame,
             text="✕ 取消",
-            bg="#CCCCCC",
-            fg="#5C3B4A",
-            font=("Microsoft YaHei", 10),
-            borderwidth=0,
-            padx=20,
-            pady=5,
+            style="Secondary.TButton",
             cursor="hand2",
             command=input_dialog.destroy,
         ).pack(side=tk.LEFT)
 
         # 回车确认
-        input_dialog.bind("<Return>", lambda e: confirm())
+        input_dialog.bind("<Return>", confirm)
 
     def _save_config(self) -> None:
         """保存配置"""
         try:
-            provider = self.config_vars["provider"].get()
-            api_key = self.config_vars["api_key"].get().strip()
-            base_url = self.config_vars["base_url"].get().strip()
+            values = {}
+            for cfg_key, ui_key, _, _ in _FIELDS:
+                value = self.config_vars[ui_key].get()
+                values[cfg_key] = value.strip() if isinstance(value, str) else value
 
             # 自定义API时必须填写base_url
-            if provider == AI_PROVIDER_CUSTOM and not base_url:
+            provider = values["ai_provider"]
+            if provider == AI_PROVIDER_CUSTOM and not values["ai_base_url"]:
                 messagebox.showwarning(
                     "提示", "自定义API模式下请填写Base URL", parent=self.dialog
                 )
                 return
 
-            update_config(
-                ai_enabled=self.config_vars["enabled"].get(),
-                ai_provider=provider,
-                ai_api_key=api_key,
-                ai_model=self.config_vars["model"].get().strip(),
-                ai_base_url=base_url,
-                ai_personality=self.config_vars["personality"].get(),
-            )
+            update_config(**values)
 
             # 重新加载AI引擎配置
             if hasattr(self.app, "ai_chat") and self.app.ai_chat:
                 self.app.ai_chat.reload_config()
 
             messagebox.showinfo("成功", "配置已保存！", parent=self.dialog)
-            self.dialog.destroy()
+            self.hide()
+            # 界面值与刚保存的配置一致，下次显示无需刷新
+            self._config_version = get_config_version()
 
         except Exception as e:
             messagebox.showerror("错误", f"保存配置失败: {e}", parent=self.dialog)
 
     def _test_connection(self) -> None:
-        """测试API连接"""
-        import threading
+        """测试API连接（测试进行中再次点击则取消）"""
+        if self._test_cancel is not None and not self._test_cancel.is_set():
+            self._cancel_test()
+            return
 
         api_key = self.config_vars["api_key"].get().strip()
         provider = self.config_vars["provider"].get()
@@ -585,129 +701,164 @@ class AIConfigDialog:
             )
             return
 
+        if not _looks_like_valid_key(provider, api_key):
+            messagebox.showwarning(
+                "提示", "API密钥格式不正确，请检查是否完整复制", parent=self.dialog
+            )
+            return
+
         # 设置默认base_url
         if not base_url:
             base_url = AI_DEFAULT_BASE_URLS.get(provider, "")
 
-        def _test():
-            try:
-                import requests
-
-                headers = {
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {api_key}",
-                }
-
-                # Kimi需要特殊处理
-                if provider == AI_PROVIDER_KIMI:
-                    headers["Authorization"] = f"Bearer {api_key}"
-                # 千问需要特殊处理
-                elif provider == AI_PROVIDER_QWEN:
-                    headers["Authorization"] = f"Bearer {api_key}"
-
-                payload = {
-                    "model": model,
-                    "messages": [{"role": "user", "content": "你好"}],
-                    "max_tokens": 10,
-                }
-
-                response = requests.post(
-                    f"{base_url}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                    timeout=15,
-                )
-
-                if response.status_code == 200:
-                    self.dialog.after(
-                        0,
-                        lambda: messagebox.showinfo(
-                            "成功",
-                            "连接测试成功！AI功能可以正常使用~",
-                            parent=self.dialog,
-                        ),
-                    )
-                elif response.status_code == 401:
-                    self.dialog.after(
-                        0,
-                        lambda: messagebox.showerror(
-                            "错误",
-                            "API密钥无效，请检查密钥是否正确",
-                            parent=self.dialog,
-                        ),
-                    )
-                else:
-                    error_text = response.text[:200]
-                    self.dialog.after(
-                        0,
-                        lambda: messagebox.showerror(
-                            "错误",
-                            f"连接失败 (状态码: {response.status_code}):\n{error_text}",
-                            parent=self.dialog,
-                        ),
-                    )
-
-            except Exception as e:
-                self.dialog.after(
-                    0,
-                    lambda: messagebox.showerror(
-                        "错误", f"测试连接时出错: {str(e)}", parent=self.dialog
-                    ),
-                )
-
-        # 显示测试中的提示
-        test_window = tk.Toplevel(self.dialog)
-        test_window.title("测试连接")
-        test_window.geometry("280x120")
-        test_window.transient(self.dialog)
-        test_window.grab_set()
-        test_window.resizable(False, False)
-        test_window.configure(bg="#FFF5F8")
-
-        # 标题栏风格
-        title_frame = tk.Frame(test_window, bg="#FF69B4", height=30)
-        title_frame.pack(fill=tk.X)
-        title_frame.pack_propagate(False)
-
-        tk.Label(
-            title_frame,
-            text="🔗 测试连接",
-            bg="#FF69B4",
-            fg="white",
-            font=("Microsoft YaHei", 11, "bold"),
-        ).pack(side=tk.LEFT, padx=15, pady=5)
-
-        # 内容
-        content_frame = tk.Frame(test_window, bg="#FFF5F8")
-        content_frame.pack(expand=True, fill=tk.BOTH, padx=20, pady=15)
-
-        # 加载动画标签
-        loading_label = tk.Label(
-            content_frame,
-            text="⏳ 正在连接AI服务...",
-            bg="#FFF5F8",
-            fg="#5C3B4A",
-            font=("Microsoft YaHei", 10),
-        )
-        loading_label.pack()
-
-        # 取消按钮
-        btn_cancel = tk.Button(
-            content_frame,
-            text="✕ 取消",
-            bg="#CCCCCC",
-            fg="#5C3B4A",
-            font=("Microsoft YaHei", 9),
-            borderwidth=0,
-            padx=15,
-            pady=4,
-            cursor="hand2",
-            command=test_window.destroy,
-        )
-        btn_cancel.pack(pady=(10, 0))
-
-        def run_test_and_close():
-            _test()
-            test_window.destroy()
+        if not _looks_like_valid_url(base_url):
+            messagebox.showwarning(
+                "提示",
+                "Base URL格式不正确，需以 http:// 或 https:// 开头",
+                parent=self.dialog,
+            )
+            return
 
-        threading.Thread(target=run_test_and_close, daemon=True).start()
+        if self._test_thread is None:
+            # 守护线程：退出程序时不会等待仍在进行的请求
+            self._test_thread = threading.Thread(
+                target=self._test_worker, name="ai-config-test", daemon=True
+            )
+            self._test_thread.start()
+
+        cancel = threading.Event()
+        self._test_cancel = cancel
+        self._set_testing(True)
+
+        future: Future = Future()
+        self._test_future = future
+        self._test_jobs.put((future, cancel, provider, api_key, model, base_url))
+        self._test_poll_id = self.dialog.after(_TEST_POLL_MS, self._poll_test_result)
+
+    def _test_worker(self) -> None:
+        """工作线程主循环：依次执行队列中的测试，收到 None 时退出"""
+        while True:
+            job = self._test_jobs.get()
+            if job is None:
+                break
+            future, *args = job
+            if future.set_running_or_notify_cancel():
+                future.set_result(self._run_test(*args))
+        if self._test_conn is not None:
+            self._test_conn.close()
+
+    def _run_test(
+        self,
+        cancel: threading.Event,
+        provider: str,
+        api_key: str,
+        model: str,
+        base_url: str,
+    ) -> tuple[bool, str]:
+        """在工作线程中发送测试请求
+
+        Returns:
+            (是否成功, 提示信息)
+        """
+        try:
+            parsed = urlparse(base_url)
+            conn = self._get_test_connection(parsed.scheme, parsed.netloc)
+            if cancel.is_set():
+                return False, ""
+
+            headers = _HEADER_BUILDERS.get(provider, _default_headers)(api_key)
+            payload = {
+                "model": model,
+                "messages": [{"role": "user", "content": "你好"}],
+                "max_tokens": 10,
+            }
+
+            # 仅发送一次请求，直接使用标准库 http.client；完整读取响应以便复用连接
+            conn.request(
+                "POST",
+                f"{parsed.path.rstrip('/')}/chat/completions",
+                body=json.dumps(payload).encode("utf-8"),
+                headers=headers,
+            )
+            response = conn.getresponse()
+            status = response.status
+            body = response.read()
+            # 测试已取消时由工作线程自行关闭连接（http.client 非线程安全）
+            if response.will_close or cancel.is_set():
+                conn.close()
+        except Exception as e:
+            if self._test_conn is not None:
+                self._test_conn.close()
+            return False, f"测试连接时出错: {str(e)}"
+
+        if status == 200:
+            return True, "连接测试成功！AI功能可以正常使用~"
+        if status == 401:
+            return False, "API密钥无效，请检查密钥是否正确"
+        error_text = body[:200].decode("utf-8", errors="replace")
+        return False, f"连接失败 (状态码: {status}):\n{error_text}"
+
+    def _get_test_connection(self, scheme: str, netloc: str) -> HTTPConnection:
+        """获取（复用）指定主机的 HTTP 连接"""
+        key = (scheme, netloc)
+        if self._test_conn is None or self._test_conn_key != key:
+            if self._test_conn is not None:
+                self._test_conn.close()
+            conn_cls = HTTPSConnection if scheme == "https" else HTTPConnection
+            self._test_conn = conn_cls(netloc, timeout=15)
+            self._test_conn_key = key
+        return self._test_conn
+
+    def _set_testing(self, testing: bool) -> None:
+        """切换测试中的界面状态（进度条与按钮文字）"""
+        progress = self._test_progress
+        button = self._test_button
+        if progress is None or button is None or not progress.winfo_exists():
+            return
+        if testing:
+            button.config(text="✕ 取消测试")
+            progress.pack(side=tk.LEFT, pady=12)
+            progress.start(15)
+        else:
+            progress.stop()
+            progress.pack_forget()
+            button.config(text="🔗 测试连接")
+
+    def _cancel_test(self) -> None:
+        """取消正在进行的连接测试"""
+        if self._test_cancel is not None:
+            self._test_cancel.set()
+        if self._test_poll_id is not None and self.dialog is not None:
+            try:
+                self.dialog.after_cancel(self._test_poll_id)
+            except tk.TclError:
+                pass
+        self._test_poll_id = None
+        # 丢弃结果：工作线程中的请求结束后不再显示
+        self._test_future = None
+        self._set_testing(False)
+
+    def _poll_test_result(self) -> None:
+        """在主线程中轮询测试结果，完成后恢复界面并显示结果"""
+        self._test_poll_id = None
+        future = self._test_future
+        if future is None:
+            return
+        if not future.done():
+            self._test_poll_id = self.dialog.after(
+                _TEST_POLL_MS, self._poll_test_result
+            )
+            return
+        self._test_future = None
+        if self._test_cancel is not None:
+            self._test_cancel.set()
+        self._set_testing(False)
+        success, message = future.result()
+        self._show_test_result(success, message)
+
+    def _show_test_result(self, success: bool, message: str) -> None:
+        """在主线程中显示连接测试结果"""
+        if success:
+            messagebox.showinfo("成功", message, parent=self.dialog)
+        else:
+            messagebox.showerror("错误", message, parent=self.dialog)
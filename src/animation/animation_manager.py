@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+import queue
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from typing import TYPE_CHECKING, Optional, Tuple
 
-from PIL import Image, ImageTk
+from PIL import Image
 
 from src.animation.cache import AnimationCache, AnimationCacheEntry
-from src.animation.gif_utils import flip_frames, load_gif_frames, load_gif_frames_raw
+from src.animation.gif_utils import (
+    EMPTY_RAW_GIF,
+    RawGif,
+    load_gif_frames_raw,
+    mirror_frames,
+    resize_frames,
+    to_photoimages,
+)
 from src.constants import (
     BEHAVIOR_MODE_ACTIVE,
-    BEHAVIOR_MODE_QUIET,
     MOTION_REST,
     SCALE_OPTIONS,
 )
@@ -19,6 +29,9 @@ from src.constants import (
 if TYPE_CHECKING:
     from src.core.pet_core import DesktopPet
 
+# 主线程检查后台音乐帧是否就绪的间隔（毫秒）
+_MUSIC_PREPARE_POLL_MS = 50
+
 
 class AnimationManager:
     """动画管理器
@@ -30,8 +43,19 @@ class AnimationManager:
     def __init__(self, app: "DesktopPet") -> None:
         self.app = app
         self.cache = AnimationCache()
-        self._raw_gif_cache: dict[str, Tuple[list, list]] = {}
-        self._raw_gif_cache_enabled = False
+        # 原始 RGBA 帧缓存（按文件名），切换缩放时只需重新缩放，无需重新解码
+        self._raw_gif_cache: dict[str, RawGif] = {}
+        # 按文件名的解码锁：后台预备音乐帧与主线程可能同时请求同一 GIF，只解码一次
+        self._raw_gif_locks: dict[str, threading.Lock] = {}
+        self._raw_gif_locks_guard = threading.Lock()
+        # 后台预备音乐帧：单个常驻工作线程 + 共享缩放线程池，结果经队列交回主线程
+        # （工作线程不调用 Tk，主循环启动前提交也不会丢失结果）
+        self._prepare_pool: Optional[ThreadPoolExecutor] = None
+        self._resize_pool: Optional[ThreadPoolExecutor] = None
+        self._music_results: queue.SimpleQueue = queue.SimpleQueue()
+        self._music_pending = 0
+        # 是否在启动时预解码音乐动画原始帧
+        self._preload_raw_gifs_enabled = False
 
     def load_animations(self) -> None:
         """加载动画资源（带缓存）"""
@@ -48,38 +72,51 @@ class AnimationManager:
             app.drag_delays = cached.drag_delays
             app.music_frames = cached.music_frames
             app.music_delays = cached.music_delays
+            # 按方向索引的移动帧：(向左, 向右)，以 moving_right 作下标
+            app._move_frames_by_dir = (app.move_frames_left, app.move_frames)
 
             app.current_frames = app.move_frames
             app.current_delays = app.move_delays
+            app.click.set_idle_gifs(app.idle_gifs)
             self._sync_window_size_and_position()
             return
 
+        # 各 GIF 的解码/缩放互不依赖，且 PIL 的解码与缩放会释放 GIL，
+        # 因此放到线程池并行执行；PhotoImage 仍在 Tk 主线程创建
+        idle_names = [f"idle{i}.gif" for i in range(1, 5)]
+        filenames = ["move.gif", "drag.gif", *idle_names]
+        with ThreadPoolExecutor(max_workers=len(filenames)) as pool:
+            futures = {
+                name: pool.submit(self._load_scaled_frames, name) for name in filenames
+            }
+            # 向左移动的帧在移动帧就绪后同样在线程池中一次性翻转
+            move_pil_frames, move_delays = futures["move.gif"].result()
+            move_left_future = pool.submit(mirror_frames, move_pil_frames)
+            decoded = {name: future.result() for name, future in futures.items()}
+            move_left_pil_frames = move_left_future.result()
+
         # 移动动画
-        move_frames, move_delays, move_pil_frames = load_gif_frames(
-            "move.gif", app.scale
-        )
-        app.move_frames = move_frames
+        app.move_frames = to_photoimages(move_pil_frames)
         app.move_delays = move_delays
-        app.move_frames_left = flip_frames(move_pil_frames)
-        move_pil_frames.clear()
+        app.move_frames_left = to_photoimages(move_left_pil_frames)
+        app._move_frames_by_dir = (app.move_frames_left, app.move_frames)
 
         # 待机动画
         app.idle_gifs = []
-        for i in range(1, 5):
-            idle_frames, idle_delays, _ = load_gif_frames(f"idle{i}.gif", app.scale)
-            if idle_frames:
-                app.idle_gifs.append((idle_frames, idle_delays))
+        for name in idle_names:
+            idle_pil_frames, idle_delays = decoded[name]
+            if idle_pil_frames:
+                app.idle_gifs.append((to_photoimages(idle_pil_frames), idle_delays))
+        app.click.set_idle_gifs(app.idle_gifs)
 
         # 拖动动画
-        drag_frames, drag_delays, _ = load_gif_frames("drag.gif", app.scale)
-        app.drag_frames = drag_frames
+        drag_pil_frames, drag_delays = decoded["drag.gif"]
+        app.drag_frames = to_photoimages(drag_pil_frames)
         app.drag_delays = drag_delays
 
-        # 音乐动画（延迟加载）
+        # 音乐动画（延迟加载，播放中时在写入缓存后补齐）
         app.music_frames = []
         app.music_delays = []
-        if getattr(app, "_music_playing", False):
-            self.ensure_music_frames()
 
         # 设置当前动画
         app.current_frames = app.move_frames
@@ -97,66 +134,180 @@ class AnimationManager:
             music_delays=app.music_delays,
         )
         self.cache.set(cache_key, entry)
-        if getattr(app, "_music_playing", False):
+        if app._music_playing:
             self.ensure_music_frames()
             self.cache.update_music(cache_key, app.music_frames, app.music_delays)
+        elif app.move_frames:
+            # 未播放音乐时在后台预备音乐动画，避免首次播放时在主线程解码/缩放
+            base_size = (app.move_frames[0].width(), app.move_frames[0].height())
+            self._submit_music_prepare(cache_key, base_size)
+
+    def _submit_music_prepare(
+        self, cache_key: int, base_size: Tuple[int, int]
+    ) -> None:
+        """提交后台音乐帧预备任务，并在主线程轮询结果"""
+        if self._prepare_pool is None:
+            self._prepare_pool = ThreadPoolExecutor(max_workers=1)
+        self._prepare_pool.submit(self._background_prepare_music, cache_key, base_size)
+        self._music_pending += 1
+        after_ids = self.app._after_ids
+        if after_ids["music_prepare"] is None:
+            after_ids["music_prepare"] = self.app.root.after(
+                _MUSIC_PREPARE_POLL_MS, self._poll_music_results
+            )
+
+    def _poll_music_results(self) -> None:
+        """主线程：安装已就绪的音乐帧，仍有未完成任务时继续轮询"""
+        app = self.app
+        app._after_ids["music_prepare"] = None
+        results = self._music_results
+        while not results.empty():
+            result = results.get_nowait()
+            self._music_pending -= 1
+            if result is not None:
+                self._install_music_photoimages(*result)
+        if self._music_pending > 0:
+            app._after_ids["music_prepare"] = app.root.after(
+                _MUSIC_PREPARE_POLL_MS, self._poll_music_results
+            )
 
     def ensure_music_frames(self) -> None:
         """确保音乐动画已加载"""
         app = self.app
-        if getattr(app, "music_frames", None) and getattr(app, "music_delays", None):
-            if app.music_frames and app.music_delays:
-                return
-
-        raw_frames, raw_delays = self._raw_gif_cache.get("ameath.gif", ([], []))
-        if not raw_frames:
-            raw_frames, raw_delays = load_gif_frames_raw("ameath.gif")
-            if self._raw_gif_cache_enabled:
-                self._raw_gif_cache["ameath.gif"] = (raw_frames, raw_delays)
-
-        app.music_delays = raw_delays
-        if getattr(app, "move_frames", None) and app.move_frames and raw_frames:
+        if app.music_frames and app.music_delays:
+            return
+
+        raw = self._get_raw_gif("ameath.gif")
+
+        app.music_delays = list(raw.delays)
+        if app.move_frames and raw.frames:
             base_size = (app.move_frames[0].width(), app.move_frames[0].height())
-            resized = [
-                frame.resize(base_size, Image.Resampling.BILINEAR)
-                for frame in raw_frames
-            ]
-            app.music_frames = [ImageTk.PhotoImage(frame) for frame in resized]
+            app.music_frames = to_photoimages(self._resize_music_frames(raw, base_size))
+
+    def _resize_music_frames(self, raw: RawGif, base_size: Tuple[int, int]) -> list:
+        """将音乐动画原始帧缩放到移动帧尺寸（纯 PIL 操作，可在工作线程中执行）"""
+        if raw.size == base_size:
+            return list(raw.frames)
+        pool = self._resize_pool
+        if pool is None:
+            pool = self._resize_pool = ThreadPoolExecutor()
+        # 目标尺寸恰为原尺寸的 1/k 时走 Image.reduce 的块平均快速路径
+        (raw_w, raw_h), (base_w, base_h) = raw.size, base_size
+        factor = raw_w // base_w if base_w else 0
+        if factor > 1 and base_w * factor == raw_w and base_h * factor == raw_h:
+            return list(pool.map(Image.Image.reduce, raw.frames, repeat(factor)))
+        return list(
+            pool.map(
+                Image.Image.resize,
+                raw.frames,
+                repeat(base_size),
+                repeat(Image.Resampling.BILINEAR),
+            )
+        )
+
+    def _background_prepare_music(
+        self, cache_key: int, base_size: Tuple[int, int]
+    ) -> None:
+        """后台线程：解码并缩放音乐动画，结果放入队列由主线程创建 PhotoImage"""
+        result = None
+        try:
+            raw = self._get_raw_gif("ameath.gif")
+            if raw.frames:
+                resized = self._resize_music_frames(raw, base_size)
+                result = (cache_key, list(raw.delays), resized)
+        finally:
+            # 失败时也要放入 None，主线程据此结束轮询
+            self._music_results.put(result)
+
+    def _install_music_photoimages(
+        self, cache_key: int, delays: list, resized: list
+    ) -> None:
+        """主线程：为后台预备好的音乐帧创建 PhotoImage 并写入缓存"""
+        app = self.app
+        cached = self.cache.get(cache_key)
+        if cached is None or cached.music_frames:
+            return
+        frames = to_photoimages(resized)
+        self.cache.update_music(cache_key, frames, delays)
+        if int(app.scale_index) == cache_key and not app.music_frames:
+            app.music_frames = frames
+            app.music_delays = delays
+
+    def _get_raw_gif(self, filename: str) -> RawGif:
+        """获取原始 RGBA 帧（首次解码后缓存，并发请求同一文件时只解码一次）"""
+        cached = self._raw_gif_cache.get(filename)
+        if cached is not None:
+            return cached
+        with self._raw_gif_locks_guard:
+            lock = self._raw_gif_locks.setdefault(filename, threading.Lock())
+        with lock:
+            cached = self._raw_gif_cache.get(filename)
+            if cached is not None:
+                return cached
+            raw_frames, raw_delays = load_gif_frames_raw(filename)
+            if not raw_frames:
+                return EMPTY_RAW_GIF
+            raw = RawGif(tuple(raw_frames), tuple(raw_delays), raw_frames[0].size)
+            self._raw_gif_cache[filename] = raw
+            return raw
+
+    def _load_scaled_frames(self, filename: str) -> Tuple[list, list]:
+        """按当前缩放比例生成 PIL 帧（可在工作线程中执行）"""
+        raw = self._get_raw_gif(filename)
+        return resize_frames(raw.frames, self.app.scale), list(raw.delays)
 
     def preload_raw_gifs(self) -> None:
         """预加载部分原始 GIF 帧，减少缩放时解码耗时"""
-        if not self._raw_gif_cache_enabled:
+        if not self._preload_raw_gifs_enabled:
             return
-        if "ameath.gif" not in self._raw_gif_cache:
-            raw_frames, raw_delays = load_gif_frames_raw("ameath.gif")
-            self._raw_gif_cache["ameath.gif"] = (raw_frames, raw_delays)
+        self._get_raw_gif("ameath.gif")
+
+    def set_label_image(self, image) -> None:
+        """设置主标签图像（与当前显示的图像相同时跳过）
+
+        Args:
+            image: 要显示的 PhotoImage
+        """
+        app = self.app
+        if image is app._last_shown_image:
+            return
+        app.label.config(image=image)
+        app._last_shown_image = image
 
     def animate(self) -> None:
         """动画循环"""
         app = self.app
-        app._animate_after_id = None
-        if not getattr(app, "current_frames", None):
-            app._animate_after_id = app.root.after(100, self.animate)
+        root = app.root
+        app._after_ids["animate"] = None
+        frames = app.current_frames
+        if not frames:
+            app._after_ids["animate"] = root.after(100, self.animate)
             return
 
-        if getattr(app, "_resizing", False):
-            app._animate_after_id = app.root.after(30, self.animate)
+        if app._resizing:
+            app._after_ids["animate"] = root.after(30, self.animate)
             return
 
-        if getattr(app, "dragging", False):
-            app._animate_after_id = app.root.after(50, self.animate)
+        if app.dragging:
+            app._after_ids["animate"] = root.after(50, self.animate)
             return
 
-        app.label.config(image=app.current_frames[app.frame_index])
-        delay = app.current_delays[app.frame_index] if app.current_delays else 100
+        idx = app.frame_index
+        delays = app.current_delays
+        image = frames[idx]
+        # 单帧动画或重复帧无需重新配置标签
+        if image is not app._last_shown_image:
+            app.label.config(image=image)
+            app._last_shown_image = image
+        delay = delays[idx] if delays else 100
 
-        app.frame_index = (app.frame_index + 1) % len(app.current_frames)
-        app._animate_after_id = app.root.after(delay, self.animate)
+        app.frame_index = (idx + 1) % len(frames)
+        app._after_ids["animate"] = root.after(delay, self.animate)
 
     def switch_to_idle(self) -> None:
         """切换到待机动画"""
         app = self.app
-        if app.is_paused or getattr(app, "_music_playing", False):
+        if app.is_paused or app._music_playing:
             return
 
         app.is_moving = False
@@ -170,28 +321,26 @@ class AnimationManager:
             app.current_delays = delays
             app.frame_index = 0
 
-        if app.behavior_mode != BEHAVIOR_MODE_QUIET:
+        if not app._behavior_is_quiet:
             return
 
     def switch_to_move(self) -> None:
         """切换到移动动画"""
         app = self.app
-        if app.is_paused or getattr(app, "_music_playing", False):
+        if app.is_paused or app._music_playing:
             return
-        if app.behavior_mode == BEHAVIOR_MODE_QUIET:
+        if app._behavior_is_quiet:
             return
 
         app.is_moving = True
         app._move_ticks_since_move = 0
-        app.current_frames = (
-            app.move_frames if app.moving_right else app.move_frames_left
-        )
+        app.current_frames = app._move_frames_by_dir[app.moving_right]
         app.current_delays = app.move_delays
         app.frame_index = 0
 
-        if app._move_after_id:
-            app.root.after_cancel(app._move_after_id)
-            app._move_after_id = None
+        if app._after_ids["move"]:
+            app.root.after_cancel(app._after_ids["move"])
+            app._after_ids["move"] = None
         app.motion.tick()
 
     def pick_idle_gif(self) -> Tuple[list, list]:
@@ -257,22 +406,19 @@ class AnimationManager:
             app.x = 200
             app.y = 200
             app.root.geometry(f"{app.w}x{app.h}+{app.x}+{app.y}")
-        app.root.update_idletasks()
+
+        # 窗口尺寸可能已变化，同步随机目标点范围
+        app.motion.refresh_bounds()
 
     def apply_scale_change(self) -> None:
         """缩放变更后的统一收尾逻辑（窗口/帧/音乐动画同步）"""
         app = self.app
 
-        # 更新窗口大小
-        self._sync_window_size_and_position()
-
         # 重置动画帧
         app.frame_index = 0
-        if getattr(app, "_music_playing", False):
+        if app._music_playing:
             if getattr(app, "_pre_music_is_moving", False):
-                app._last_frames = (
-                    app.move_frames if app.moving_right else app.move_frames_left
-                )
+                app._last_frames = app._move_frames_by_dir[app.moving_right]
                 app._last_delays = app.move_delays
             elif app.idle_gifs:
                 frames, delays = self.pick_idle_gif()
@@ -286,11 +432,15 @@ class AnimationManager:
                 app.current_frames = frames
                 app.current_delays = delays
             else:
-                app.current_frames = (
-                    app.move_frames if app.moving_right else app.move_frames_left
-                )
+                app.current_frames = app._move_frames_by_dir[app.moving_right]
                 app.current_delays = app.move_delays
 
+        self._commit_scale_change()
+
+    def _commit_scale_change(self) -> None:
+        """一次性提交缩放变更：窗口几何、首帧图像，最后统一刷新一次布局"""
+        app = self.app
+        self._sync_window_size_and_position()
         if app.current_frames:
-            app.label.config(image=app.current_frames[0])
-            app.root.update_idletasks()
+            self.set_label_image(app.current_frames[0])
+        app.root.update_idletasks()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -21,17 +22,25 @@ class AnimationCacheEntry:
 
 
 class AnimationCache:
-    """按 scale_index 缓存动画资源"""
+    """按 scale_index 缓存动画资源（LRU，保留最近使用的少量档位）"""
+
+    # 最多缓存的缩放档位数，来回切换相邻档位时无需重新加载
+    max_entries = 3
 
     def __init__(self) -> None:
-        self._cache: dict[int, AnimationCacheEntry] = {}
+        self._cache: OrderedDict[int, AnimationCacheEntry] = OrderedDict()
 
     def get(self, key: int) -> Optional[AnimationCacheEntry]:
-        return self._cache.get(key)
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+        return entry
 
     def set(self, key: int, entry: AnimationCacheEntry) -> None:
-        self._prune_keep(key)
         self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
 
     def update_music(self, key: int, music_frames: list, music_delays: list) -> None:
         entry = self._cache.get(key)
@@ -39,8 +48,3 @@ class AnimationCache:
             return
         entry.music_frames = music_frames
         entry.music_delays = music_delays
-
-    def _prune_keep(self, keep_key: int) -> None:
-        for k in list(self._cache.keys()):
-            if k != keep_key:
-                del self._cache[k]
@@ -1,11 +1,10 @@
 """动画处理模块"""
 
-import itertools
 import time
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, NamedTuple, Optional, Sequence, Tuple
 
-from PIL import Image, ImageTk
+from PIL import Image, ImageSequence, ImageTk
 
 from src.constants import GIF_DIR
 from src.utils import resource_path
@@ -14,6 +13,111 @@ from src.utils import resource_path
 FrameSet = Tuple[List[ImageTk.PhotoImage], List[int], List[Image.Image]]
 
 
+class RawGif(NamedTuple):
+    """解码后的原始 GIF（帧与延迟分开存放，均为不可变元组）"""
+
+    frames: Tuple[Image.Image, ...]
+    delays: Tuple[int, ...]
+    size: Tuple[int, int]
+
+
+EMPTY_RAW_GIF = RawGif((), (), (0, 0))
+
+# GIF 资源目录（打包后路径在运行期间不变，导入时解析一次）
+_GIF_BASE = Path(resource_path(str(GIF_DIR)))
+
+# 是否打印 GIF 解码耗时（调试用，关闭时不计时也不输出）
+DEBUG_GIF_TIMING = False
+
+# 低于该缩放比例时使用 LANCZOS（大幅缩小时抗锯齿更明显），否则使用更快的 BILINEAR
+LANCZOS_SCALE_THRESHOLD = 0.6
+
+
+def get_resample(scale: float) -> Image.Resampling:
+    """根据缩放比例选择重采样算法
+
+    Args:
+        scale: 缩放比例
+
+    Returns:
+        PIL 重采样算法
+    """
+    if scale < LANCZOS_SCALE_THRESHOLD:
+        return Image.Resampling.LANCZOS
+    return Image.Resampling.BILINEAR
+
+
+def get_reduce_factor(scale: float) -> Optional[int]:
+    """缩放比例为 1/k（k 为整数）时返回 k，否则返回 None
+
+    Args:
+        scale: 缩放比例
+
+    Returns:
+        整数缩小倍数或 None
+    """
+    if not 0 < scale < 1:
+        return None
+    inv = 1.0 / scale
+    factor = round(inv)
+    if abs(inv - factor) < 1e-3:
+        return int(factor)
+    return None
+
+
+def scale_frame(
+    frame: Image.Image, scale: float, resample: Image.Resampling
+) -> Image.Image:
+    """缩放单帧，整数倍缩小时走 Image.reduce 的块平均快速路径
+
+    Args:
+        frame: PIL 帧
+        scale: 缩放比例
+        resample: 非整数倍时使用的重采样算法
+
+    Returns:
+        缩放后的 PIL 帧
+    """
+    factor = get_reduce_factor(scale)
+    if factor is not None:
+        return frame.reduce(factor)
+    w, h = frame.size
+    # 确保缩放后尺寸有效
+    new_size = (max(1, int(w * scale)), max(1, int(h * scale)))
+    return frame.resize(new_size, resample)
+
+
+def resize_frames(frames: Sequence[Image.Image], scale: float) -> List[Image.Image]:
+    """按比例缩放原始帧（纯 PIL 操作，可在工作线程中执行）
+
+    Args:
+        frames: 原始 PIL 帧列表
+        scale: 缩放比例
+
+    Returns:
+        缩放后的 PIL 帧列表
+    """
+    resample = get_resample(scale)
+    return [scale_frame(frame, scale, resample) for frame in frames]
+
+
+def to_rgba(frame: Image.Image) -> Image.Image:
+    """取得帧的独立 RGBA 副本
+
+    ImageSequence 迭代时复用同一图像对象，必须复制；Pillow 对 GIF 的后续帧
+    通常已解码为 RGBA，此时直接内存复制，省去一次模式转换。
+
+    Args:
+        frame: 当前 GIF 帧
+
+    Returns:
+        RGBA 模式的 PIL 帧
+    """
+    if frame.mode == "RGBA":
+        return frame.copy()
+    return frame.convert("RGBA")
+
+
 def load_gif_frames_raw(filename: str) -> Tuple[List[Image.Image], List[int]]:
     """加载 GIF 原始帧（不缩放）
 
@@ -23,8 +127,8 @@ def load_gif_frames_raw(filename: str) -> Tuple[List[Image.Image], List[int]]:
     Returns:
         (PIL帧列表, 延迟列表)
     """
-    path = Path(resource_path(str(GIF_DIR))) / filename
-    start_time = time.perf_counter()
+    path = _GIF_BASE / filename
+    start_time = time.perf_counter() if DEBUG_GIF_TIMING else 0.0
     pil_frames: List[Image.Image] = []
     delays: List[int] = []
 
@@ -35,78 +139,103 @@ def load_gif_frames_raw(filename: str) -> Tuple[List[Image.Image], List[int]]:
         return [], []
 
     frame_count = 0
-    for i in itertools.count():
-        try:
-            gif.seek(i)
-            frame = gif.convert("RGBA")
-            pil_frames.append(frame)
-            delays.append(gif.info.get("duration", 80))
-            frame_count += 1
-        except EOFError:
-            break
-
-    elapsed_ms = int((time.perf_counter() - start_time) * 1000)
-    print(f"GIF原始加载耗时 {elapsed_ms}ms | {filename} | frames={frame_count}")
+    for gif_frame in ImageSequence.Iterator(gif):
+        pil_frames.append(to_rgba(gif_frame))
+        delays.append(gif_frame.info.get("duration", 80))
+        frame_count += 1
+
+    if DEBUG_GIF_TIMING:
+        elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+        print(f"GIF原始加载耗时 {elapsed_ms}ms | {filename} | frames={frame_count}")
 
     return pil_frames, delays
 
 
-def load_gif_frames(filename: str, scale: float = 1.0) -> FrameSet:
-    """加载并缩放 GIF 文件
+def decode_gif_frames(
+    filename: str, scale: float = 1.0
+) -> Tuple[List[Image.Image], List[int]]:
+    """解码并缩放 GIF 帧（纯 PIL 操作，可在工作线程中执行）
 
     Args:
         filename: GIF 文件名（相对于 gifs 目录）
         scale: 缩放比例
 
     Returns:
-        (PhotoImage帧列表, 延迟列表, PIL帧列表)
+        (缩放后的PIL帧列表, 延迟列表)
     """
-    photoimage_frames: List[ImageTk.PhotoImage] = []
     pil_frames: List[Image.Image] = []
     delays: List[int] = []
 
-    path = Path(resource_path(str(GIF_DIR))) / filename
+    path = _GIF_BASE / filename
 
-    start_time = time.perf_counter()
+    start_time = time.perf_counter() if DEBUG_GIF_TIMING else 0.0
     try:
         gif = Image.open(path)
     except (FileNotFoundError, IOError) as e:
         print(f"无法加载 GIF 文件 {filename}: {e}")
-        return [], [], []
+        return [], []
 
+    resample = get_resample(scale)
     frame = None
     frame_count = 0
-    for i in itertools.count():
-        try:
-            gif.seek(i)
-            frame = gif.convert("RGBA")
-            w, h = frame.size
-
-            # 确保缩放后尺寸有效
-            new_w = max(1, int(w * scale))
-            new_h = max(1, int(h * scale))
-
-            resized = frame.resize((new_w, new_h), Image.Resampling.LANCZOS)
-            photoimage_frames.append(ImageTk.PhotoImage(resized))
-            pil_frames.append(resized)
-            delays.append(gif.info.get("duration", 80))
-            frame_count += 1
-        except EOFError:
-            break
+    for gif_frame in ImageSequence.Iterator(gif):
+        frame = to_rgba(gif_frame)
+        pil_frames.append(scale_frame(frame, scale, resample))
+        delays.append(gif_frame.info.get("duration", 80))
+        frame_count += 1
 
     # 确保至少有一帧
-    if not photoimage_frames and frame is not None:
-        fallback = frame.resize((100, 100), Image.Resampling.LANCZOS)
-        photoimage_frames.append(ImageTk.PhotoImage(fallback))
-        pil_frames.append(fallback)
+    if not pil_frames and frame is not None:
+        pil_frames.append(frame.resize((100, 100), resample))
         delays.append(80)
 
-    elapsed_ms = int((time.perf_counter() - start_time) * 1000)
-    print(
-        f"GIF加载耗时 {elapsed_ms}ms | {filename} | scale={scale} | frames={frame_count}"
-    )
+    if DEBUG_GIF_TIMING:
+        elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+        print(
+            f"GIF加载耗时 {elapsed_ms}ms | {filename} | scale={scale} "
+            f"| frames={frame_count}"
+        )
+
+    return pil_frames, delays
+
+
+def to_photoimages(frames: Sequence[Image.Image]) -> List[ImageTk.PhotoImage]:
+    """将 PIL 帧转换为 PhotoImage（必须在 Tk 主线程调用）
 
-    return photoimage_frames, delays, pil_frames
+    Args:
+        frames: PIL Image 帧列表
+
+    Returns:
+        PhotoImage 列表
+    """
+    return [ImageTk.PhotoImage(frame) for frame in frames]
+
+
+def load_gif_frames(filename: str, scale: float = 1.0) -> FrameSet:
+    """加载并缩放 GIF 文件
+
+    Args:
+        filename: GIF 文件名（相对于 gifs 目录）
+        scale: 缩放比例
+
+    Returns:
+        (PhotoImage帧列表, 延迟列表, PIL帧列表)
+    """
+    pil_frames, delays = decode_gif_frames(filename, scale)
+    return to_photoimages(pil_frames), delays, pil_frames
+
+
+def mirror_frames(frames: Sequence[Image.Image]) -> List[Image.Image]:
+    """水平翻转所有 PIL Image 帧（纯 PIL 操作，可在工作线程中执行）
+
+    Args:
+        frames: PIL Image 帧列表
+
+    Returns:
+        翻转后的 PIL Image 列表
+    """
+    flip = Image.Transpose.FLIP_LEFT_RIGHT
+    return [img.transpose(flip) for img in frames]
 
 
 def flip_frames(frames: List[Image.Image]) -> List[ImageTk.PhotoImage]:
@@ -118,10 +247,7 @@ def flip_frames(frames: List[Image.Image]) -> List[ImageTk.PhotoImage]:
     Returns:
         翻转后的 PhotoImage 列表
     """
-    return [
-        ImageTk.PhotoImage(img.transpose(Image.Transpose.FLIP_LEFT_RIGHT))
-        for img in frames
-    ]
+    return to_photoimages(mirror_frames(frames))
 
 
 def load_all_animations(scale: float) -> dict:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from src.constants import (
@@ -27,8 +28,9 @@ class BehaviorParams:
     min_move_ticks: int
 
 
+@lru_cache(maxsize=8)
 def get_behavior_params(mode: str) -> BehaviorParams:
-    """根据模式返回行为参数"""
+    """根据模式返回行为参数（参数不可变，按模式缓存）"""
     if mode == BEHAVIOR_MODE_QUIET:
         return BehaviorParams(
             follow_override=False,
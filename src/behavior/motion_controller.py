@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 import random
 from typing import TYPE_CHECKING, Optional, Tuple
 
@@ -12,8 +13,9 @@ from src.constants import (
     BEHAVIOR_MODE_CLINGY,
     BEHAVIOR_MODE_QUIET,
     FOLLOW_DISTANCE,
-    FOLLOW_START_DIST,
+    FOLLOW_START_DIST_SQ,
     FOLLOW_STOP_DIST,
+    FOLLOW_STOP_DIST_SQ,
     INERTIA_FACTOR,
     INTENT_FACTOR,
     JITTER,
@@ -25,7 +27,7 @@ from src.constants import (
     MOVE_INTERVAL,
     OUTSIDE_TARGET_CHANCE,
     REST_CHANCE,
-    REST_DISTANCE,
+    REST_DISTANCE_SQ,
     REST_DURATION_MAX,
     REST_DURATION_MIN,
     RESPAWN_MARGIN,
@@ -42,6 +44,67 @@ from src.constants import (
 if TYPE_CHECKING:
     from src.core.pet_core import DesktopPet
 
+# 暂停与安静模式下的运动轮询间隔（毫秒）
+_PAUSED_TICK_INTERVAL = 250
+_QUIET_TICK_INTERVAL = 500
+
+# 屏幕外随机目标点距屏幕边缘的距离
+_OUTSIDE_MARGIN = RESPAWN_MARGIN + 50
+
+# 各运动状态的基础速度倍率
+_SPEED_MUL_TABLE = {
+    MOTION_WANDER: SPEED_WANDER,
+    MOTION_FOLLOW: SPEED_FOLLOW,
+    MOTION_CURIOUS: SPEED_CURIOUS,
+}
+
+
+def step_position(
+    x: float,
+    y: float,
+    vx: float,
+    vy: float,
+    w: int,
+    h: int,
+    screen_w: int,
+    screen_h: int,
+) -> Tuple[float, float, float, float, bool]:
+    """积分一帧位置并在屏幕边缘反弹（纯数值计算，不访问 app）
+
+    Args:
+        x: 当前 x 坐标
+        y: 当前 y 坐标
+        vx: x 方向速度（已叠加抖动）
+        vy: y 方向速度（已叠加抖动）
+        w: 窗口宽度
+        h: 窗口高度
+        screen_w: 屏幕宽度
+        screen_h: 屏幕高度
+
+    Returns:
+        (新 x, 新 y, 新 vx, 新 vy, 是否碰到边缘)
+    """
+    x += vx
+    y += vy
+
+    # 越界时夹回边界；速度朝外时取反（朝内则保持），无需 abs 调用
+    low_x = x <= 0
+    hit_x = low_x or x + w >= screen_w
+    if hit_x:
+        x = 0 if low_x else screen_w - w
+        if (vx < 0) == low_x:
+            vx = -vx
+
+    low_y = y <= 0
+    hit_y = low_y or y + h >= screen_h
+    if hit_y:
+        y = 0 if low_y else screen_h - h
+        if (vy < 0) == low_y:
+            vy = -vy
+
+    hit_edge = hit_x or hit_y
+    return x, y, vx, vy, hit_edge
+
 
 class MotionController:
     """运动控制器
@@ -51,255 +114,271 @@ class MotionController:
 
     def __init__(self, app: "DesktopPet") -> None:
         self.app = app
+        # 预先绑定随机数方法，热路径上省去模块属性查找
+        self._rand = random.random
+        # 随机目标点取值范围缓存（见 refresh_bounds）
+        self._tx_max = 0
+        self._ty_max = 0
+        self._screen_w = 0
+        self._screen_h = 0
+
+    def _rand_int(self, a: int, b: int) -> int:
+        """返回 [a, b] 区间的随机整数
+
+        直接由 random() 缩放得到，绕开 randint -> randrange 的参数校验路径。
+        """
+        return a + int(self._rand() * (b - a + 1))
 
     def init_state(self) -> None:
         """初始化运动相关状态（目标点/计时器等）"""
+        self.refresh_bounds()
         self.app.target_x, self.app.target_y = self._get_random_target()
-        self.app.target_timer = random.randint(TARGET_CHANGE_MIN, TARGET_CHANGE_MAX)
+        self.app.target_timer = self._rand_int(TARGET_CHANGE_MIN, TARGET_CHANGE_MAX)
         self.app.rest_timer = 0
 
     def tick(self) -> None:
         """运动状态机主循环（性能优化版）"""
-        self.app._move_after_id = None
-        if self.app._music_playing:
+        # 热路径：app 及其频繁读写的字段绑定为局部变量，末尾统一写回
+        app = self.app
+        rand = self._rand
+        rand_int = self._rand_int
+        app._after_ids["move"] = None
+        if app._music_playing:
             return self._schedule(MOVE_INTERVAL if MOVE_INTERVAL < 100 else 100)
 
-        if self.app.is_paused or self.app.dragging:
-            delay = 100 if self.app.is_paused else 50
+        # 暂停/安静模式下不会移动，拉长轮询间隔减少唤醒；
+        # 恢复时由 switch_to_move / apply_behavior_mode 立即重新调度
+        if app.is_paused or app.dragging:
+            delay = _PAUSED_TICK_INTERVAL if app.is_paused else 50
             return self._schedule(delay)
 
-        if self.app.behavior_mode == BEHAVIOR_MODE_QUIET:
-            if self.app.is_moving:
-                self.app._switch_to_idle()
-            return self._schedule(MOVE_INTERVAL)
+        if app._behavior_is_quiet:
+            if app.is_moving:
+                app._switch_to_idle()
+            self._flush_panel_positions()
+            return self._schedule(_QUIET_TICK_INTERVAL)
+
+        motion_state = app.motion_state
 
         # 随机停下休息
-        if self.app.motion_state == MOTION_WANDER and self.app.is_moving:
-            stop_chance = self.app._behavior_stop_chance
-            if stop_chance is None:
-                stop_chance = STOP_CHANCE
+        if motion_state == MOTION_WANDER and app.is_moving:
             if (
-                self.app._move_ticks_since_move >= self.app._behavior_min_move_ticks
-                and random.random() < stop_chance
+                app._move_ticks_since_move >= app._behavior_min_move_ticks
+                and rand() < app._stop_chance_eff
             ):
-                self.app.motion_state = MOTION_REST
-                self.app.rest_timer = random.randint(
-                    STOP_DURATION_MIN, STOP_DURATION_MAX
-                )
-                self.app._switch_to_idle()
+                app.motion_state = MOTION_REST
+                app.rest_timer = rand_int(STOP_DURATION_MIN, STOP_DURATION_MAX)
+                app._switch_to_idle()
+                self._flush_panel_positions()
                 return self._schedule(MOVE_INTERVAL)
 
         # 休息状态处理
-        if self.app.motion_state == MOTION_REST:
-            self.app.rest_timer -= MOVE_INTERVAL
-            if self.app.rest_timer <= 0:
-                self.app.motion_state = MOTION_WANDER
-                self.app.target_x, self.app.target_y = self._get_random_target()
-                self.app.target_timer = random.randint(
-                    TARGET_CHANGE_MIN, TARGET_CHANGE_MAX
-                )
-                self.app._switch_to_move()
+        if motion_state == MOTION_REST:
+            app.rest_timer -= MOVE_INTERVAL
+            if app.rest_timer <= 0:
+                app.motion_state = MOTION_WANDER
+                app.target_x, app.target_y = self._get_random_target()
+                app.target_timer = rand_int(TARGET_CHANGE_MIN, TARGET_CHANGE_MAX)
+                app._switch_to_move()
+            else:
+                self._flush_panel_positions()
             return self._schedule(MOVE_INTERVAL)
 
-        mx = self.app.root.winfo_pointerx()
-        my = self.app.root.winfo_pointery()
-        mouse_moved = (mx, my) != self.app._last_mouse
-        self.app._last_mouse = (mx, my)
-
-        dx = self.app.target_x - self.app.x
-        dy = self.app.target_y - self.app.y
+        x = app.x
+        y = app.y
+        tx = app.target_x
+        ty = app.target_y
+        dx = tx - x
+        dy = ty - y
         dist_sq = dx * dx + dy * dy
-        dist = dist_sq**0.5 if dist_sq > 0 else 1
 
-        follow_mouse = self.app.follow_mouse
-        if self.app._behavior_follow_override is not None:
-            follow_mouse = self.app._behavior_follow_override
-        if self.app.behavior_mode == BEHAVIOR_MODE_ACTIVE:
+        follow_mouse = app.follow_mouse
+        if app._behavior_follow_override is not None:
+            follow_mouse = app._behavior_follow_override
+        if app.behavior_mode == BEHAVIOR_MODE_ACTIVE:
             follow_mouse = False
 
-        if not follow_mouse and self.app.motion_state in (
-            MOTION_FOLLOW,
-            MOTION_CURIOUS,
-        ):
-            self.app.motion_state = MOTION_WANDER
+        if not follow_mouse and motion_state in (MOTION_FOLLOW, MOTION_CURIOUS):
+            motion_state = MOTION_WANDER
 
+        # 仅跟随鼠标时才查询指针位置（Tk 往返调用开销较大）
+        mouse_moved = False
         if follow_mouse:
-            dist_mouse_sq = (mx - self.app.x) ** 2 + (my - self.app.y) ** 2
-            if dist_mouse_sq > FOLLOW_START_DIST**2:
-                self.app.motion_state = MOTION_FOLLOW
-            elif dist_mouse_sq < FOLLOW_STOP_DIST**2:
-                self.app.motion_state = MOTION_CURIOUS
+            mx = app.root.winfo_pointerx()
+            my = app.root.winfo_pointery()
+            mouse_moved = (mx, my) != app._last_mouse
+            app._last_mouse = (mx, my)
+            dist_mouse_sq = (mx - x) ** 2 + (my - y) ** 2
+            if dist_mouse_sq > FOLLOW_START_DIST_SQ:
+                motion_state = MOTION_FOLLOW
+            elif dist_mouse_sq < FOLLOW_STOP_DIST_SQ:
+                motion_state = MOTION_CURIOUS
             else:
-                self.app.motion_state = MOTION_WANDER
-        elif self.app.motion_state == MOTION_WANDER and dist < REST_DISTANCE:
-            rest_chance = self.app._behavior_rest_chance
-            if rest_chance is None:
-                rest_chance = REST_CHANCE
-            if random.random() < rest_chance:
-                self.app.motion_state = MOTION_REST
-                self.app.rest_timer = random.randint(
-                    REST_DURATION_MIN, REST_DURATION_MAX
-                )
-                self.app._switch_to_idle()
-                self.app.root.after(MOVE_INTERVAL, self.tick)
-                return
-            self.app.target_x, self.app.target_y = self._get_random_target()
-            self.app.target_timer = random.randint(TARGET_CHANGE_MIN, TARGET_CHANGE_MAX)
-
-        if self.app.motion_state == MOTION_WANDER:
-            self.app.target_timer -= 1
-            if self.app.target_timer <= 0:
-                self.app.target_x, self.app.target_y = self._get_random_target()
-                target_min = self.app._behavior_target_min
-                target_max = self.app._behavior_target_max
-                if target_min is None:
-                    target_min = TARGET_CHANGE_MIN
-                if target_max is None:
-                    target_max = TARGET_CHANGE_MAX
-                self.app.target_timer = random.randint(target_min, target_max)
-
-        speed_mul = self._get_speed_multiplier()
-
-        if self.app.motion_state in (MOTION_FOLLOW, MOTION_CURIOUS) and mouse_moved:
+                motion_state = MOTION_WANDER
+        elif motion_state == MOTION_WANDER and dist_sq < REST_DISTANCE_SQ:
+            if rand() < app._rest_chance_eff:
+                app.motion_state = MOTION_REST
+                app.rest_timer = rand_int(REST_DURATION_MIN, REST_DURATION_MAX)
+                app._switch_to_idle()
+                self._flush_panel_positions()
+                return self._schedule(MOVE_INTERVAL)
+            tx, ty = self._get_random_target()
+            app.target_timer = rand_int(TARGET_CHANGE_MIN, TARGET_CHANGE_MAX)
+
+        app.motion_state = motion_state
+
+        if motion_state == MOTION_WANDER:
+            app.target_timer -= 1
+            if app.target_timer <= 0:
+                tx, ty = self._get_random_target()
+                app.target_timer = rand_int(app._target_min_eff, app._target_max_eff)
+
+        if mouse_moved and motion_state in (MOTION_FOLLOW, MOTION_CURIOUS):
             offset = (
-                FOLLOW_DISTANCE
-                if self.app.motion_state == MOTION_FOLLOW
-                else FOLLOW_STOP_DIST
+                FOLLOW_DISTANCE if motion_state == MOTION_FOLLOW else FOLLOW_STOP_DIST
             )
-            self.app.target_x = mx + random.randint(-offset, offset)
-            self.app.target_y = my + random.randint(-offset, offset)
-            dx = self.app.target_x - self.app.x
-            dy = self.app.target_y - self.app.y
-            dist = max(1, (dx * dx + dy * dy) ** 0.5)
-
-        desired_vx = dx / dist * self.app._speed_x * speed_mul
-        desired_vy = dy / dist * self.app._speed_y * speed_mul
-        self.app.vx = self.app.vx * INERTIA_FACTOR + desired_vx * INTENT_FACTOR
-        self.app.vy = self.app.vy * INERTIA_FACTOR + desired_vy * INTENT_FACTOR
-
-        if self.app.is_moving and not self.app._music_playing:
-            new_moving_right = self.app.vx >= 0.5
-            new_moving_left = self.app.vx <= -0.5
-            if new_moving_right and not self.app.moving_right:
-                self.app.moving_right = True
-                self.app.current_frames = self.app.move_frames
-                self.app.current_delays = self.app.move_delays
-                self.app.frame_index = 0
-            elif new_moving_left and self.app.moving_right:
-                self.app.moving_right = False
-                self.app.current_frames = self.app.move_frames_left
-                self.app.current_delays = self.app.move_delays
-                self.app.frame_index = 0
-
-        self.app._move_tick += 1
-        if self.app._move_tick % JITTER_INTERVAL == 0:
-            self.app._jitter_x = random.uniform(-JITTER, JITTER)
-            self.app._jitter_y = random.uniform(-JITTER, JITTER)
-
-        self.app.vx += self.app._jitter_x
-        self.app.vy += self.app._jitter_y
-        self.app.x += self.app.vx
-        self.app.y += self.app.vy
-
-        self._handle_edge()
-
-        ix, iy = int(self.app.x), int(self.app.y)
-        if (ix, iy) != self.app._last_pos:
-            self.app.root.geometry(f"+{ix}+{iy}")
-            self.app._last_pos = (ix, iy)
-            if hasattr(self.app, "speech_bubble") and self.app.speech_bubble:
-                self.app.speech_bubble.update_position()
-            if hasattr(self.app, "pomodoro_indicator") and self.app.pomodoro_indicator:
-                self.app.pomodoro_indicator.update_position()
-            if hasattr(self.app, "music_panel") and self.app.music_panel:
-                self.app.music_panel.update_position()
-
-        self.app._move_ticks_since_move += 1
+            tx = mx + rand_int(-offset, offset)
+            ty = my + rand_int(-offset, offset)
+            dx = tx - x
+            dy = ty - y
+            dist_sq = dx * dx + dy * dy
+        app.target_x = tx
+        app.target_y = ty
+
+        if dist_sq > 1:
+            # 仅在需要单位方向时开方，且只开一次
+            scale = self._get_speed_multiplier() * INTENT_FACTOR / math.sqrt(dist_sq)
+            vx = app.vx * INERTIA_FACTOR + dx * scale * app._speed_x
+            vy = app.vy * INERTIA_FACTOR + dy * scale * app._speed_y
+        else:
+            # 已到达目标点：无需意图速度，只保留惯性衰减
+            vx = app.vx * INERTIA_FACTOR
+            vy = app.vy * INERTIA_FACTOR
+
+        if app.is_moving and not app._music_playing:
+            self._update_facing(vx)
+
+        app._jitter_countdown -= 1
+        if app._jitter_countdown <= 0:
+            app._jitter_countdown = JITTER_INTERVAL
+            app._jitter_x = (rand() * 2.0 - 1.0) * JITTER
+            app._jitter_y = (rand() * 2.0 - 1.0) * JITTER
+
+        x, y, vx, vy, hit_edge = step_position(
+            x,
+            y,
+            vx + app._jitter_x,
+            vy + app._jitter_y,
+            app.w,
+            app.h,
+            app.screen_w,
+            app.screen_h,
+        )
+        app.x, app.y, app.vx, app.vy = x, y, vx, vy
+        if hit_edge:
+            # 碰到屏幕边缘反弹后，按新速度方向更新朝向
+            self._update_facing(vx)
+
+        ix, iy = int(x), int(y)
+        pos = (ix, iy)
+        if pos != app._last_pos:
+            app.root.wm_geometry(f"+{ix}+{iy}")
+            app._last_pos = pos
+
+        # 浮动面板跟随：位移不足 2 像素时最多延后 3 帧再同步，减少 Tk geometry 调用
+        if pos != app._last_panel_pos:
+            app._frames_since_panel_sync += 1
+            px, py = app._last_panel_pos
+            if abs(ix - px) + abs(iy - py) >= 2 or app._frames_since_panel_sync >= 3:
+                app._last_panel_pos = pos
+                app._frames_since_panel_sync = 0
+                self._update_panel_positions()
+
+        app._move_ticks_since_move += 1
         return self._schedule(MOVE_INTERVAL)
 
+    def _flush_panel_positions(self) -> None:
+        """停止移动时补齐被延后的面板同步，避免面板停在偏移位置"""
+        app = self.app
+        pos = app._last_pos
+        if pos is not None and pos != app._last_panel_pos:
+            app._last_panel_pos = pos
+            app._frames_since_panel_sync = 0
+            self._update_panel_positions()
+
+    def _update_panel_positions(self) -> None:
+        """同步跟随宠物的浮动面板位置"""
+        app = self.app
+        speech_bubble = app.speech_bubble
+        if speech_bubble is not None:
+            speech_bubble.update_position()
+        pomodoro_indicator = app.pomodoro_indicator
+        if pomodoro_indicator is not None:
+            pomodoro_indicator.update_position()
+        music_panel = app.music_panel
+        if music_panel is not None:
+            music_panel.update_position()
+
     def _schedule(self, delay: int) -> None:
-        if self.app._move_after_id:
-            self.app.root.after_cancel(self.app._move_after_id)
-            self.app._move_after_id = None
-        self.app._move_after_id = self.app.root.after(delay, self.tick)
+        # tick 入口已清空 _after_ids["move"]，常规路径下无需 after_cancel
+        app = self.app
+        if app._after_ids["move"] is not None:
+            app.root.after_cancel(app._after_ids["move"])
+        app._after_ids["move"] = app.root.after(delay, self.tick)
+
+    def refresh_bounds(self) -> None:
+        """缓存随机目标点的取值范围（屏幕或窗口尺寸变化后调用）"""
+        app = self.app
+        screen_w = getattr(app, "screen_w", None)
+        screen_h = getattr(app, "screen_h", None)
+        if screen_w is None or screen_h is None:
+            # 屏幕尺寸尚未初始化，由 init_state 再次刷新
+            return
+        self._tx_max = screen_w - app.w
+        self._ty_max = screen_h - app.h
+        self._screen_w = screen_w
+        self._screen_h = screen_h
 
     def _get_random_target(self) -> Tuple[int, int]:
-        if random.random() < OUTSIDE_TARGET_CHANCE:
-            side = random.choice(["left", "right", "top", "bottom"])
-            margin = RESPAWN_MARGIN + 50
-            if side == "left":
-                return (-margin, random.randint(0, self.app.screen_h - self.app.h))
-            if side == "right":
-                return (
-                    self.app.screen_w + margin,
-                    random.randint(0, self.app.screen_h - self.app.h),
-                )
-            if side == "top":
-                return (random.randint(0, self.app.screen_w - self.app.w), -margin)
-            return (
-                random.randint(0, self.app.screen_w - self.app.w),
-                self.app.screen_h + margin,
-            )
-        return (
-            random.randint(0, self.app.screen_w - self.app.w),
-            random.randint(0, self.app.screen_h - self.app.h),
-        )
+        rand_int = self._rand_int
+        tx_max = self._tx_max
+        ty_max = self._ty_max
+        if self._rand() < OUTSIDE_TARGET_CHANCE:
+            # 随机选择屏幕外的一侧：0 左、1 右、2 上、3 下
+            side = rand_int(0, 3)
+            margin = _OUTSIDE_MARGIN
+            if side == 0:
+                return (-margin, rand_int(0, ty_max))
+            if side == 1:
+                return (self._screen_w + margin, rand_int(0, ty_max))
+            if side == 2:
+                return (rand_int(0, tx_max), -margin)
+            return (rand_int(0, tx_max), self._screen_h + margin)
+        return (rand_int(0, tx_max), rand_int(0, ty_max))
 
     def _get_speed_multiplier(self) -> float:
-        multipliers = {
-            MOTION_WANDER: SPEED_WANDER,
-            MOTION_FOLLOW: SPEED_FOLLOW,
-            MOTION_CURIOUS: SPEED_CURIOUS,
-        }
-        base = multipliers.get(self.app.motion_state, 1.0)
+        base = _SPEED_MUL_TABLE.get(self.app.motion_state, 1.0)
         return base * self.app._behavior_speed_mul
 
-    def _handle_edge(self) -> None:
-        # 出屏（保持原行为：目前不处理重生）
-        if (
-            self.app.x < -self.app.w
-            or self.app.x > self.app.screen_w
-            or self.app.y < -self.app.h
-            or self.app.y > self.app.screen_h
-        ):
-            pass
-
-        hit_edge = False
-        if self.app.x <= 0:
-            self.app.x = 0
-            self.app.vx = abs(self.app.vx)
-            hit_edge = True
-        elif self.app.x + self.app.w >= self.app.screen_w:
-            self.app.x = self.app.screen_w - self.app.w
-            self.app.vx = -abs(self.app.vx)
-            hit_edge = True
-
-        if self.app.y <= 0:
-            self.app.y = 0
-            self.app.vy = abs(self.app.vy)
-            hit_edge = True
-        elif self.app.y + self.app.h >= self.app.screen_h:
-            self.app.y = self.app.screen_h - self.app.h
-            self.app.vy = -abs(self.app.vy)
-            hit_edge = True
-
-        if hit_edge:
-            new_moving_right = self.app.vx > 0.5
-            new_moving_left = self.app.vx < -0.5
-            if new_moving_right and not self.app.moving_right:
-                self.app.moving_right = True
-                self.app.current_frames = self.app.move_frames
-                self.app.current_delays = self.app.move_delays
-                self.app.frame_index = 0
-            elif new_moving_left and self.app.moving_right:
-                self.app.moving_right = False
-                self.app.current_frames = self.app.move_frames_left
-                self.app.current_delays = self.app.move_delays
-                self.app.frame_index = 0
+    def _update_facing(self, vx: float) -> None:
+        """按水平速度更新朝向，方向改变时切换对应的移动帧"""
+        app = self.app
+        moving_right = app.moving_right
+        if moving_right:
+            if vx > -0.5:
+                return
+        elif vx < 0.5:
+            return
+        app.moving_right = not moving_right
+        app.current_frames = app._move_frames_by_dir[not moving_right]
+        app.current_delays = app.move_delays
+        app.frame_index = 0
 
     def apply_behavior_mode(self, mode: str) -> None:
         """应用行为模式参数"""
         self.app.behavior_mode = mode
+        # 点击/动画/移动热路径直接读取布尔标志，无需逐次比较模式字符串
+        self.app._behavior_is_quiet = mode == BEHAVIOR_MODE_QUIET
         params = get_behavior_params(mode)
         self.app._behavior_follow_override = params.follow_override
         self.app._behavior_stop_chance = params.stop_chance
@@ -308,6 +387,19 @@ class MotionController:
         self.app._behavior_target_max = params.target_max
         self.app._behavior_speed_mul = params.speed_mul
         self.app._behavior_min_move_ticks = params.min_move_ticks
+        # 预先合并默认值，tick 中直接读取生效参数
+        stop_chance = params.stop_chance
+        rest_chance = params.rest_chance
+        target_min = params.target_min
+        target_max = params.target_max
+        self.app._stop_chance_eff = STOP_CHANCE if stop_chance is None else stop_chance
+        self.app._rest_chance_eff = REST_CHANCE if rest_chance is None else rest_chance
+        self.app._target_min_eff = (
+            TARGET_CHANGE_MIN if target_min is None else target_min
+        )
+        self.app._target_max_eff = (
+            TARGET_CHANGE_MAX if target_max is None else target_max
+        )
 
         if params.follow_override is not None:
             self.app.set_follow_mouse(params.follow_override)
@@ -322,8 +414,11 @@ class MotionController:
         ):
             self.app.motion_state = MOTION_WANDER
             self.app._switch_to_move()
+        elif self.app._after_ids["move"] is not None:
+            # 离开安静模式时替换掉挂起的长间隔定时器，恢复常规节奏
+            self._schedule(MOVE_INTERVAL)
 
-        if hasattr(self.app, "tray_controller") and self.app.tray_controller:
+        if self.app.tray_controller is not None:
             if self.app.tray_controller.icon:
                 self.app.tray_controller.icon.menu = (
                     self.app.tray_controller.build_menu()
@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import heapq
 import random
 from datetime import datetime
-from typing import TYPE_CHECKING
-
-from src.constants import REMINDERS, SLEEP_SPEED_MULTIPLIER, REMINDER_CHANCE
+from typing import TYPE_CHECKING, Optional
+
+from src.ai.emys_character import EMYS_RESPONSES
+from src.constants import (
+    REMINDER_CHANCE,
+    REMINDERS,
+    SLEEP_SPEED_MULTIPLIER,
+    TIME_AFTERNOON_START,
+    TIME_EVENING_START,
+    TIME_MORNING_START,
+    TIME_NIGHT_START,
+    TIME_NOON_START,
+    TIME_SLEEP_START,
+)
 
 if TYPE_CHECKING:
     from src.core.pet_core import DesktopPet
@@ -16,7 +28,7 @@ class RoutineManager:
     """智能作息系统管理器
 
     为减少改动，作息相关状态字段仍保存在 app 上（例如
-    `_current_time_period/_last_reminder_time/_is_sleeping/...`）。
+    `_current_time_period/_reminder_heap/_is_sleeping/...`）。
     """
 
     def __init__(self, app: "DesktopPet") -> None:
@@ -25,23 +37,27 @@ class RoutineManager:
     def init_state(self) -> None:
         """初始化作息相关状态"""
         self.app._current_time_period = self.get_time_period()
-        self.app._last_reminder_time = {}
+        # 提醒最小堆：(下次可触发的时间戳, 定义顺序, 提醒类型)，只需检查堆顶
+        # 初始时间戳为 0 表示启动后即可触发，同时到期时按 REMINDERS 定义顺序
+        self.app._reminder_heap = [
+            (0.0, order, reminder_type)
+            for order, reminder_type in enumerate(REMINDERS)
+        ]
         self.app._is_sleeping = False
         self.app._original_speed_x = self.app._speed_x
         self.app._original_speed_y = self.app._speed_y
 
-    def get_time_period(self) -> str:
-        """获取当前时间段"""
-        from src.constants import (
-            TIME_AFTERNOON_START,
-            TIME_EVENING_START,
-            TIME_MORNING_START,
-            TIME_NIGHT_START,
-            TIME_NOON_START,
-            TIME_SLEEP_START,
-        )
+    def get_time_period(self, hour: Optional[int] = None) -> str:
+        """获取时间段
+
+        Args:
+            hour: 小时数（0-23），为 None 时取当前时间
 
-        hour = datetime.now().hour
+        Returns:
+            时间段名称
+        """
+        if hour is None:
+            hour = datetime.now().hour
         if TIME_SLEEP_START <= hour < TIME_MORNING_START:
             return "sleep"
         if TIME_MORNING_START <= hour < TIME_NOON_START:
@@ -54,15 +70,14 @@ class RoutineManager:
             return "evening"
         return "night"
 
-    def tick(self) -> None:
-        """检查作息状态（每分钟调用一次）"""
-        self.app._routine_after_id = None
-        current_period = self.get_time_period()
+    def tick_once(self) -> None:
+        """检查作息状态（由 DesktopPet 的监督循环每分钟调用一次，不自行调度）"""
+        # 本次检查只取一次当前时间，时间段与提醒间隔共用
+        now_dt = datetime.now()
+        current_period = self.get_time_period(now_dt.hour)
         if current_period != self.app._current_time_period:
             self.app._current_time_period = current_period
 
-            from src.ai.emys_character import EMYS_RESPONSES
-
             if current_period == "sleep":
                 self.app._is_sleeping = True
                 self.app._speed_x = int(
@@ -91,23 +106,17 @@ class RoutineManager:
             # 60%概率触发提醒，40%概率触发闲聊
             if random.random() < 0.6:
                 # 触发提醒
-                current_time = datetime.now()
-                for reminder_type, config in REMINDERS.items():
-                    last_time = self.app._last_reminder_time.get(reminder_type)
-                    if (
-                        last_time is None
-                        or (current_time - last_time).total_seconds() / 60
-                        >= config["interval"]
-                    ):
-                        message = random.choice(config["messages"])
-                        self.app.speech_bubble.show(message, duration=5000)
-                        self.app._last_reminder_time[reminder_type] = current_time
-                        break
+                now = now_dt.timestamp()
+                heap = self.app._reminder_heap
+                next_due, order, reminder_type = heap[0]
+                if next_due <= now:
+                    config = REMINDERS[reminder_type]
+                    message = random.choice(config["messages"])
+                    self.app.speech_bubble.show(message, duration=5000)
+                    heapq.heapreplace(
+                        heap, (now + config["interval"] * 60, order, reminder_type)
+                    )
             else:
                 # 触发闲聊 random_chat
-                from src.ai.emys_character import EMYS_RESPONSES
-
                 message = random.choice(EMYS_RESPONSES["random_chat"])
                 self.app.speech_bubble.show(message, duration=5000)
-
-        self.app._routine_after_id = self.app.root.after(60000, self.tick)
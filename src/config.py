@@ -1,7 +1,8 @@
 """配置管理模块"""
 
 import json
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 from src.constants import (
     AI_DEFAULT_MODELS,
     AI_PROVIDER_DEEPSEEK,
@@ -14,6 +15,8 @@ from src.constants import (
 
 # 配置缓存
 _config_cache: Optional[Dict[str, Any]] = None
+# 配置版本号，缓存内容每次变化（重新读取/保存）时递增
+_config_version = 0
 
 
 def _default_config() -> Dict[str, Any]:
@@ -51,14 +54,13 @@ def load_config(force_refresh: bool = False) -> Dict[str, Any]:
     Returns:
         配置字典
     """
-    global _config_cache
+    global _config_cache, _config_version
 
     if not force_refresh and _config_cache is not None:
         return _config_cache.copy()
 
     try:
-        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(CONFIG_FILE.read_bytes())
     except FileNotFoundError:
         print(f"配置文件不存在，使用默认配置")
         data = _default_config()
@@ -67,22 +69,54 @@ def load_config(force_refresh: bool = False) -> Dict[str, Any]:
         data = _default_config()
 
     _config_cache = data.copy()
+    _config_version += 1
     return data
 
 
+def _load_config_nocopy() -> Dict[str, Any]:
+    """返回缓存的配置字典本身（不复制，调用方只能读取，不得修改）
+
+    Returns:
+        缓存中的配置字典
+    """
+    if _config_cache is None:
+        load_config()
+    return _config_cache
+
+
+def get_config_snapshot() -> Mapping[str, Any]:
+    """获取只读配置快照（直接引用缓存，不复制、不读盘）
+
+    Returns:
+        只读配置映射
+    """
+    return MappingProxyType(_load_config_nocopy())
+
+
+def get_config_version() -> int:
+    """获取当前配置版本号，可用于判断快照是否已过期
+
+    Returns:
+        配置版本号
+    """
+    return _config_version
+
+
 def save_config(config: Dict[str, Any]) -> None:
     """保存配置到文件
 
     Args:
         config: 配置字典
     """
-    global _config_cache
+    global _config_cache, _config_version
 
     try:
         CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(config, f, ensure_ascii=False, indent=2)
+        # 先整体序列化再一次性写入（json.dump 会分块多次写文件）
+        payload = json.dumps(config, ensure_ascii=False, indent=2)
+        CONFIG_FILE.write_bytes(payload.encode("utf-8"))
         _config_cache = config.copy()
+        _config_version += 1
     except (OSError, IOError) as e:
         print(f"保存配置失败: {e}")
 
@@ -96,10 +130,9 @@ def update_config(**kwargs) -> Dict[str, Any]:
     Returns:
         更新后的配置字典
     """
-    config = load_config()
-    config.update(kwargs)
+    config = {**_load_config_nocopy(), **kwargs}
     save_config(config)
-    return config.copy()
+    return config
 
 
 def get_config_value(key: str, default=None) -> Any:
@@ -112,5 +145,4 @@ def get_config_value(key: str, default=None) -> Any:
     Returns:
         配置值
     """
-    config = load_config()
-    return config.get(key, default)
+    return _load_config_nocopy().get(key, default)
@@ -7,11 +7,12 @@ import os
 BASE_DIR = Path(__file__).resolve().parent.parent
 GIF_DIR = BASE_DIR / "assets" / "gifs"
 CONFIG_FILE = Path(os.environ.get("APPDATA", Path.home())) / "ameath_config.json"
+VERSION_CACHE_FILE = CONFIG_FILE.with_name("ameath_version_cache.json")
 
 # ============ 显示配置 ============
 SCALE_OPTIONS = [0.3, 0.5, 0.7, 0.9, 1.1, 1.3, 1.5, 1.7, 1.9]
 DEFAULT_SCALE_INDEX = 3
-TRANSPARENCY_OPTIONS = [1.0, 0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3]
+TRANSPARENCY_OPTIONS = (1.0, 0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3)
 DEFAULT_TRANSPARENCY_INDEX = 0
 TRANSPARENT_COLOR = "pink"
 
@@ -57,11 +58,15 @@ REST_CHANCE = 0.6
 REST_DURATION_MIN = 1000
 REST_DURATION_MAX = 3000
 REST_DISTANCE = 20
+REST_DISTANCE_SQ = REST_DISTANCE * REST_DISTANCE
 STAY_PUT_CHANCE = 0.3
 
 # ============ 跟随参数 ============
 FOLLOW_START_DIST = 200
 FOLLOW_STOP_DIST = 60
+# 平方距离，比较时无需开方
+FOLLOW_START_DIST_SQ = FOLLOW_START_DIST * FOLLOW_START_DIST
+FOLLOW_STOP_DIST_SQ = FOLLOW_STOP_DIST * FOLLOW_STOP_DIST
 
 # ============ 速度倍率 ============
 SPEED_WANDER = 0.8
@@ -78,6 +83,8 @@ SWP_SHOWWINDOW = 0x0040
 GWL_EXSTYLE = -20
 WS_EX_LAYERED = 0x00080000
 WS_EX_TRANSPARENT = 0x00000020
+WS_EX_TOPMOST = 0x00000008
+GW_HWNDPREV = 3
 
 # ============ 注册表配置 ============
 RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
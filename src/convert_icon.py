@@ -1,14 +1,33 @@
+"""构建脚本：将 GIF 首帧转换为多尺寸 ICO 图标
+
+用法：python src/convert_icon.py
+"""
+
 from PIL import Image
-import os
 
 # 转换gif为ico
 gif_path = "assets/gifs/ameath.gif"
 ico_path = "assets/gifs/ameath.ico"
 
-img = Image.open(gif_path)
-img.save(
-    ico_path,
-    format="ICO",
-    sizes=[(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)],
-)
-print(f"图标已保存到: {ico_path}")
+ICON_SIZES = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
+
+
+def convert_icon(src: str = gif_path, dst: str = ico_path) -> None:
+    """将 GIF 首帧保存为 ICO
+
+    只取第一帧；先用 LANCZOS 缩放到最大尺寸，再由 ICO 编码器生成各小尺寸。
+
+    Args:
+        src: GIF 文件路径
+        dst: ICO 输出路径
+    """
+    with Image.open(src) as img:
+        img.seek(0)
+        frame = img.convert("RGBA")
+    largest = frame.resize(ICON_SIZES[0], Image.Resampling.LANCZOS)
+    largest.save(dst, format="ICO", sizes=ICON_SIZES)
+    print(f"图标已保存到: {dst}")
+
+
+if __name__ == "__main__":
+    convert_icon()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import random
 import tkinter as tk
-from typing import Any, Tuple
+from typing import TYPE_CHECKING, Any, Tuple
 
 from src.config import load_config, update_config
 from src.constants import (
@@ -32,6 +32,16 @@ from src.ai import AIChatEngine, AIConfigDialog
 from src.ui.ai_chat_panel import AIChatPanel
 from src.translate import TranslateWindow
 
+if TYPE_CHECKING:
+    from src.platform.tray import TrayController
+    from src.ui.music_panel import MusicPanel
+    from src.ui.pomodoro_indicator import PomodoroIndicator
+    from src.ui.speech_bubble import SpeechBubble
+
+# 监督循环（1 秒周期）中各子任务的执行间隔（单位：次）
+_TOPMOST_EVERY_TICKS = 2
+_ROUTINE_EVERY_TICKS = 60
+
 
 class DesktopPet:
     """桌面宠物主类"""
@@ -39,6 +49,41 @@ class DesktopPet:
     # 类变量用于系统托盘
     tray_icon: Any = None
 
+    # 实例字段固定声明为槽位（各管理器直接读写 app 上的字段，新增字段须在此登记）
+    __slots__ = (
+        # 公共状态、组件与管理器
+        "ai_chat", "ai_chat_panel", "ai_config_dialog", "animation", "auto_startup",
+        "behavior_mode", "click", "click_through", "current_delays", "current_frames",
+        "drag", "drag_delays", "drag_frames", "drag_start_x", "drag_start_y",
+        "dragging", "follow_mouse", "frame_index", "h", "hwnd", "idle_gifs",
+        "is_moving", "is_paused", "label", "motion", "motion_state", "move_delays",
+        "move_frames", "move_frames_left", "moving_right", "music", "music_delays",
+        "music_frames", "music_panel", "pomodoro", "pomodoro_indicator", "quick_menu",
+        "rest_timer", "root", "routine", "scale", "scale_index", "scale_options",
+        "screen_h", "screen_w", "speech_bubble", "state", "target_timer", "target_x",
+        "target_y", "translate_window", "transparency_index", "tray_controller", "vx",
+        "vy", "w", "window", "x", "y",
+        # 内部状态（多数由 StateManager.init_state 初始化）
+        "_after_ids", "_behavior_follow_override", "_behavior_is_quiet",
+        "_behavior_min_move_ticks", "_behavior_rest_chance", "_behavior_speed_mul",
+        "_behavior_stop_chance", "_behavior_target_max", "_behavior_target_min",
+        "_click_count", "_current_time_period", "_drag_started",
+        "_frames_since_panel_sync", "_idle_cycle", "_is_showing_greeting",
+        "_is_sleeping", "_jitter_countdown", "_jitter_x", "_jitter_y",
+        "_last_click_time", "_last_delays", "_last_frames", "_last_idle_index",
+        "_last_mouse", "_last_panel_pos", "_last_pos", "_last_shown_image",
+        "_mouse_down_x", "_mouse_down_y", "_move_frames_by_dir",
+        "_move_ticks_since_move", "_music_index", "_music_length_cache",
+        "_music_pause_start", "_music_paused", "_music_paused_total", "_music_playing",
+        "_music_playlist", "_music_start_time", "_original_speed_x",
+        "_original_speed_y", "_pending_drag", "_pomodoro_enabled", "_pomodoro_paused",
+        "_pomodoro_phase", "_pomodoro_remaining", "_pomodoro_total", "_pre_drag_delays",
+        "_pre_drag_frames", "_pre_music_is_moving", "_pre_music_motion_state",
+        "_quit_var", "_reminder_heap", "_request_quit", "_resizing", "_rest_chance_eff",
+        "_speed_x", "_speed_y", "_stop_chance_eff", "_supervisor_ticks",
+        "_target_max_eff", "_target_min_eff",
+    )
+
     def __init__(self, root: tk.Tk):
         """初始化桌面宠物
 
@@ -48,6 +93,31 @@ class DesktopPet:
         self.root = root
         self._request_quit = False
         self._resizing = False
+        # 动画循环热路径直接读取的字段，需在加载动画/初始化状态前就存在
+        self.dragging = False
+        self._music_playing = False
+        self.current_frames: list = []
+        self.current_delays: list = []
+        self.frame_index = 0
+        # 主标签当前显示的图像（见 AnimationManager.set_label_image）
+        self._last_shown_image = None
+        # after 任务句柄（按子系统登记，退出时统一取消，避免 TclError）；
+        # 加载动画时就可能调度任务，因此在创建管理器之前初始化
+        self._after_ids: dict[str, str | None] = {
+            "animate": None,
+            "move": None,
+            "supervisor": None,
+            "pomodoro": None,
+            "music": None,
+            "music_prepare": None,
+            "idle": None,
+        }
+        # 浮动 UI 组件（由 StateManager 创建），预置为 None 以便用 is not None 判断
+        self.speech_bubble: SpeechBubble | None = None
+        self.pomodoro_indicator: PomodoroIndicator | None = None
+        self.music_panel: MusicPanel | None = None
+        # 托盘控制器（由 main 在创建托盘后设置）
+        self.tray_controller: TrayController | None = None
 
         # 组合式管理器
         self.window = WindowManager(self)
@@ -66,6 +136,9 @@ class DesktopPet:
         # AI聊天面板
         self.ai_chat_panel: AIChatPanel | None = None
 
+        # AI配置对话框（首次打开时创建）
+        self.ai_config_dialog: AIConfigDialog | None = None
+
         # 翻译窗口
         self.translate_window = TranslateWindow(self)
 
@@ -151,22 +224,25 @@ class DesktopPet:
 
     def _bind_events(self) -> None:
         """绑定事件"""
-        self.label.bind("<ButtonPress-1>", self.click.on_mouse_down)
-        self.label.bind("<B1-Motion>", self.drag.do_drag)
-        self.label.bind("<ButtonRelease-1>", self.click.on_mouse_up)
-        # 右键点击事件
-        self.label.bind("<ButtonPress-3>", self.click.on_right_click)
+        bind = self.label.bind
+        for sequence, callback in (
+            ("<ButtonPress-1>", self.click.on_mouse_down),
+            ("<B1-Motion>", self.drag.do_drag),
+            ("<ButtonRelease-1>", self.click.on_mouse_up),
+            # 右键点击事件
+            ("<ButtonPress-3>", self.click.on_right_click),
+        ):
+            bind(sequence, callback)
 
     def _start_loops(self) -> None:
         """启动循环"""
-        self.music.init_backend()
+        # 音频设备在首次播放时才初始化，这里只预先扫描播放列表
+        self.music.prefetch_playlist()
         self.animation.animate()
         self.motion.tick()
-        self._topmost_after_id = self.root.after(2000, self._ensure_topmost)
-        self._quit_after_id = self.root.after(100, self._check_quit)
-        self._routine_after_id = self.root.after(
-            1000, self.routine.tick
-        )  # 1秒后开始作息检查
+        # 置顶维护与作息检查合并为一个 1 秒周期的监督循环
+        self._supervisor_ticks = 0
+        self._after_ids["supervisor"] = self.root.after(1000, self._supervisor_tick)
 
     # ============ 番茄钟（兼容对外方法名） ============
 
@@ -231,6 +307,8 @@ class DesktopPet:
                 self.current_frames = frames
                 self.current_delays = delays
                 self.frame_index = 0
+                if frames:
+                    self.animation.set_label_image(frames[0])
         else:
             self.animation.switch_to_move()
 
@@ -263,7 +341,7 @@ class DesktopPet:
         # 重新加载动画
         self.animation.load_animations()
 
-        if hasattr(self, "tray_controller") and self.tray_controller:
+        if self.tray_controller is not None:
             if self.tray_controller.icon:
                 self.tray_controller.icon.menu = self.tray_controller.build_menu()
 
@@ -287,58 +365,57 @@ class DesktopPet:
         return set_auto_startup(enable)
 
     def request_quit(self) -> None:
-        """请求退出"""
-        self._request_quit = True
+        """请求退出（可在托盘/快捷键线程中调用）
 
-    def _ensure_topmost(self) -> None:
-        """确保窗口置顶"""
-        self._topmost_after_id = None
-        if not self.is_paused:
+        写入 Tk 变量后由其 trace 回调在 Tk 主线程执行退出流程，无需轮询。
+        """
+        if self._request_quit:
+            return
+        self._request_quit = True
+        self._quit_var.set(1)
+
+    def _supervisor_tick(self) -> None:
+        """监督循环（每秒一次）：每 2 秒确保置顶，启动 1 秒后起每分钟检查作息"""
+        self._after_ids["supervisor"] = None
+        ticks = self._supervisor_ticks + 1
+        self._supervisor_ticks = ticks
+        if ticks % _ROUTINE_EVERY_TICKS == 1:
+            self.routine.tick_once()
+        if ticks % _TOPMOST_EVERY_TICKS == 0 and not self.is_paused:
             self.window.ensure_topmost()
-        self._topmost_after_id = self.root.after(2000, self._ensure_topmost)
+        self._after_ids["supervisor"] = self.root.after(1000, self._supervisor_tick)
 
-    def _check_quit(self) -> None:
-        """检查退出标志"""
-        self._quit_after_id = None
-        if self._request_quit:
-            self._cancel_pending_afters()
-            self.music.stop()
-            # 注销全局快捷键
-            from src.platform.hotkey import hotkey_manager
+    def _on_quit_requested(self) -> None:
+        """执行退出流程（由 _quit_var 的 trace 回调触发）"""
+        self._cancel_pending_afters()
+        self.music.stop()
+        # 注销全局快捷键
+        from src.platform.hotkey import hotkey_manager
 
-            hotkey_manager.unregister_all()
+        hotkey_manager.unregister_all()
 
-            # 关闭AI聊天面板
-            self.close_ai_chat_panel()
+        # 关闭AI聊天面板
+        self.close_ai_chat_panel()
 
-            if hasattr(self, "tray_controller") and self.tray_controller:
-                self.tray_controller.stop()
-            if hasattr(self, "music_panel") and self.music_panel:
-                self.music_panel.hide()
-            self.root.destroy()
-            return
-        self._quit_after_id = self.root.after(100, self._check_quit)
+        if self.tray_controller is not None:
+            self.tray_controller.stop()
+        if self.music_panel is not None:
+            self.music_panel.hide()
+        if self.ai_config_dialog is not None:
+            self.ai_config_dialog.destroy()
+        self.root.destroy()
 
     def _cancel_pending_afters(self) -> None:
         """取消已调度的 after 任务，避免退出时报 TclError"""
-        after_ids: list[tuple[str, Optional[str]]] = [
-            ("_animate_after_id", getattr(self, "_animate_after_id", None)),
-            ("_move_after_id", getattr(self, "_move_after_id", None)),
-            ("_routine_after_id", getattr(self, "_routine_after_id", None)),
-            ("_topmost_after_id", getattr(self, "_topmost_after_id", None)),
-            ("_quit_after_id", getattr(self, "_quit_after_id", None)),
-            ("_pomodoro_after_id", getattr(self, "_pomodoro_after_id", None)),
-            ("_music_after_id", getattr(self, "_music_after_id", None)),
-        ]
-
-        for name, after_id in after_ids:
+        after_ids = self._after_ids
+        for key, after_id in after_ids.items():
             if not after_id:
                 continue
             try:
                 self.root.after_cancel(after_id)
             except tk.TclError:
                 pass
-            setattr(self, name, None)
+            after_ids[key] = None
 
     def toggle_music_playback(self) -> bool:
         """切换音乐播放
@@ -536,8 +613,9 @@ class DesktopPet:
 
     def show_ai_config_dialog(self) -> None:
         """显示AI配置对话框"""
-        config_dialog = AIConfigDialog(self)
-        config_dialog.show()
+        if self.ai_config_dialog is None:
+            self.ai_config_dialog = AIConfigDialog(self)
+        self.ai_config_dialog.show()
 
     def clear_ai_history(self) -> None:
         """清空AI对话历史"""
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
+import tkinter as tk
 from typing import TYPE_CHECKING, Optional, Tuple
 
 from src.constants import (
     BEHAVIOR_MODE_ACTIVE,
+    JITTER_INTERVAL,
     MOTION_WANDER,
+    REST_CHANCE,
     SPEED_X,
     SPEED_Y,
+    STOP_CHANCE,
+    TARGET_CHANGE_MAX,
+    TARGET_CHANGE_MIN,
 )
-from src.ui.music_panel import MusicPanel
-from src.ui.pomodoro_indicator import PomodoroIndicator
-from src.ui.quick_menu import QuickMenu
-from src.ui.speech_bubble import SpeechBubble
 
 if TYPE_CHECKING:
     from src.core.pet_core import DesktopPet
@@ -25,6 +27,8 @@ class StateManager:
     说明：为了降低拆分风险，状态字段仍保存在 app 上；此管理器负责集中初始化。
     """
 
+    __slots__ = ("app",)
+
     def __init__(self, app: "DesktopPet") -> None:
         self.app = app
 
@@ -80,7 +84,9 @@ class StateManager:
         # 性能优化缓存
         app._last_mouse: Tuple[int, int] = (0, 0)
         app._last_pos: Optional[Tuple[int, int]] = None
-        app._move_tick = 0
+        app._last_panel_pos: Tuple[int, int] = (0, 0)
+        app._frames_since_panel_sync = 0
+        app._jitter_countdown = JITTER_INTERVAL
         app._jitter_x = 0.0
         app._jitter_y = 0.0
 
@@ -88,12 +94,17 @@ class StateManager:
         app._idle_cycle = []
         app._last_idle_index: Optional[int] = None
 
-        # 互动系统
+        # 互动系统（UI 组件模块在此处才导入，不拖慢 pet_core 的导入）
+        from src.ui.music_panel import MusicPanel
+        from src.ui.pomodoro_indicator import PomodoroIndicator
+        from src.ui.quick_menu import QuickMenu
+        from src.ui.speech_bubble import SpeechBubble
+
         app.speech_bubble = SpeechBubble(app)
         app.quick_menu = QuickMenu(app)
         app.pomodoro_indicator = PomodoroIndicator(app)
         app.music_panel = MusicPanel(app)
-        app._last_click_time = 0
+        app._last_click_time = 0  # time.monotonic_ns() 时间戳
         app._click_count = 0
         app._is_showing_greeting = False
 
@@ -108,26 +119,24 @@ class StateManager:
         app._behavior_target_max: Optional[int] = None
         app._behavior_speed_mul = 1.0
         app._behavior_min_move_ticks = 0
+        # 合并默认值后的生效参数（由 apply_behavior_mode 更新）
+        app._stop_chance_eff = STOP_CHANCE
+        app._rest_chance_eff = REST_CHANCE
+        app._target_min_eff = TARGET_CHANGE_MIN
+        app._target_max_eff = TARGET_CHANGE_MAX
 
-        app._move_after_id = None
         app._move_ticks_since_move = 0
 
-        # after 任务句柄（用于退出时取消，避免 TclError）
-        app._animate_after_id = None
-        app._routine_after_id = None
-        app._topmost_after_id = None
-        app._quit_after_id = None
-        app._music_after_id = None
-
         # 番茄钟状态
         app._pomodoro_enabled = False
         app._pomodoro_phase = "work"
         app._pomodoro_remaining = 0
         app._pomodoro_paused = False
-        app._pomodoro_after_id = None
         app._pomodoro_total = 0
 
-        app._idle_after_id = None
+        # 退出请求：写入该变量即触发退出流程（订阅代替每 100ms 轮询）
+        app._quit_var = tk.IntVar(master=app.root, value=0)
+        app._quit_var.trace_add("write", lambda *_: app._on_quit_requested())
 
         # 应用行为模式（读取自配置）
         if getattr(app, "behavior_mode", None) is None:
@@ -7,7 +7,12 @@ from typing import TYPE_CHECKING, Optional
 import tkinter as tk
 
 from src.constants import TRANSPARENT_COLOR, TRANSPARENCY_OPTIONS
-from src.platform.system import get_window_handle, set_click_through, set_window_topmost
+from src.platform.system import (
+    get_window_handle,
+    is_window_front_topmost,
+    set_click_through,
+    set_window_topmost,
+)
 
 if TYPE_CHECKING:
     from src.core.pet_core import DesktopPet
@@ -20,6 +25,8 @@ class WindowManager:
     初始化与对 Windows API 的调用。
     """
 
+    __slots__ = ("app", "_tk_call", "_root_path")
+
     def __init__(self, app: "DesktopPet") -> None:
         self.app = app
 
@@ -30,6 +37,9 @@ class WindowManager:
         root.attributes("-topmost", True)
         root.config(bg=TRANSPARENT_COLOR)
         root.attributes("-transparentcolor", TRANSPARENT_COLOR)
+        # 预先取得 Tcl 调用入口与窗口路径，调整透明度时直接发送 wm attributes
+        self._tk_call = root.tk.call
+        self._root_path = root._w
 
         label = tk.Label(root, bg=TRANSPARENT_COLOR, bd=0)
         label.pack()
@@ -47,8 +57,9 @@ class WindowManager:
         """设置窗口透明度（不负责持久化）"""
         if not (0 <= index < len(TRANSPARENCY_OPTIONS)):
             return
-        alpha = TRANSPARENCY_OPTIONS[index]
-        self.app.root.attributes("-alpha", alpha)
+        self._tk_call(
+            "wm", "attributes", self._root_path, "-alpha", TRANSPARENCY_OPTIONS[index]
+        )
 
     def set_click_through(self, enable: bool) -> None:
         """设置鼠标穿透"""
@@ -57,7 +68,13 @@ class WindowManager:
             set_click_through(hwnd, enable)
 
     def ensure_topmost(self) -> None:
-        """确保窗口置顶"""
+        """确保窗口置顶
+
+        先用只读的 Z 序查询判断是否仍在置顶层最前，只有被其他置顶窗口压住时
+        才调用 SetWindowPos。
+        """
         hwnd: Optional[int] = getattr(self.app, "hwnd", None)
-        if hwnd:
+        if not hwnd:
+            return
+        if not is_window_front_topmost(hwnd):
             set_window_topmost(hwnd)
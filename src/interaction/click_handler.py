@@ -5,26 +5,61 @@ from __future__ import annotations
 import os
 import random
 import subprocess
+import threading
 import time
-from typing import TYPE_CHECKING
+from collections import deque
+from typing import TYPE_CHECKING, Callable
 
 import tkinter as tk
 
-from src.constants import BEHAVIOR_MODE_QUIET
+from src.config import get_config_snapshot, get_config_version
 
 if TYPE_CHECKING:
     from src.core.pet_core import DesktopPet
 
+# 双击判定间隔（纳秒）
+_DOUBLE_CLICK_NS = 300_000_000
+
 
 class ClickHandler:
     """点击处理器（单击/双击/与拖动判定协作）"""
 
+    __slots__ = (
+        "app",
+        "_click_animation_after_id",
+        "_pending_event",
+        "_rapid_click_times",
+        "_rapid_click_timeout",
+        "_quick_launch",
+        "_quick_launch_version",
+        "_click_idle_gifs",
+        "_rest_idle_gif",
+    )
+
     def __init__(self, app: "DesktopPet") -> None:
         self.app = app
         self._click_animation_after_id = None
+        # 等待单击判定超时的鼠标事件（见 _single_click_timeout）
+        self._pending_event: tk.Event | None = None
         # 快速点击启动相关
-        self._rapid_click_times: list[float] = []
-        self._rapid_click_timeout = 2000  # 2秒时间窗口
+        self._rapid_click_times: deque[int] = deque(maxlen=5)
+        self._rapid_click_timeout = 2_000_000_000  # 2秒时间窗口（纳秒）
+        # 快速启动配置缓存（见 _get_quick_launch）
+        self._quick_launch: tuple[bool, str, int] = (False, "", 5)
+        self._quick_launch_version = -1
+        # 安静模式单击动画缓存（见 set_idle_gifs）
+        self._click_idle_gifs: tuple = ()
+        self._rest_idle_gif: tuple | None = None
+
+    def set_idle_gifs(self, idle_gifs: list) -> None:
+        """缓存安静模式单击用到的待机动画（动画加载/切换缩放后调用）
+
+        Args:
+            idle_gifs: 待机动画列表 [(帧列表, 延迟列表), ...]
+        """
+        # 单击时随机播放 idle3 / idle4，结束后回到 idle2
+        self._click_idle_gifs = tuple(idle_gifs[2:4]) if len(idle_gifs) >= 4 else ()
+        self._rest_idle_gif = idle_gifs[1] if len(idle_gifs) > 1 else None
 
     def on_mouse_down(self, event: tk.Event) -> None:
         """鼠标按下事件 - 处理单击/双击/拖动"""
@@ -38,16 +73,18 @@ class ClickHandler:
         app._mouse_down_y = event.y
         app._drag_started = False
 
-        current_time = int(time.time() * 1000)
+        # 单调时钟不受系统时间调整影响
+        current_time = time.monotonic_ns()
         time_since_last_click = current_time - app._last_click_time
 
-        if time_since_last_click < 300:
+        if time_since_last_click < _DOUBLE_CLICK_NS:
             app._click_count = 2
             self._handle_double_click(event)
         else:
             app._click_count = 1
             app._last_click_time = current_time
-            app.root.after(300, lambda: self._handle_single_click(event))
+            self._pending_event = event
+            app.root.after(300, self._single_click_timeout)
 
     def on_mouse_up(self, event: tk.Event) -> None:
         """鼠标释放事件"""
@@ -60,71 +97,86 @@ class ClickHandler:
         """鼠标右键点击事件 - 检测快速右键点击"""
         self._check_rapid_clicks()
 
+    def _single_click_timeout(self) -> None:
+        """单击判定超时：处理等待中的单击事件"""
+        event = self._pending_event
+        self._pending_event = None
+        if event is not None:
+            self._handle_single_click(event)
+
     def _handle_single_click(self, event: tk.Event) -> None:
-        """处理单击"""
+        """处理单击（按 安静模式/音乐播放/音乐面板可见 查表分派）"""
         app = self.app
         if app._click_count != 1:
             return
         if app._drag_started:
             return
 
-        # 安静模式下随机播放 idle3 或 idle4 动画
-        if app.behavior_mode == BEHAVIOR_MODE_QUIET:
-            # 音乐播放时禁止单击动画切换和气泡显示
-            if app._music_playing:
-                # 音乐播放模式下单击时显示歌名和音乐控制组件
-                if app.music_panel.is_visible():
-                    app.music_panel.hide()
-                    app.speech_bubble.hide()
-                else:
-                    app.music_panel.show()
-                    title = app.get_current_music_title()
-                    if title:
-                        app.speech_bubble.show(
-                            f"🎵 {title}", duration=None, allow_during_music=True
-                        )
-                return
+        music_playing = app._music_playing
+        key = (
+            app._behavior_is_quiet,
+            music_playing,
+            music_playing and app.music_panel.is_visible(),
+        )
+        self._SINGLE_CLICK_ACTIONS[key](self)
 
-            # 取消之前的定时器
-            if self._click_animation_after_id:
-                app.root.after_cancel(self._click_animation_after_id)
-                self._click_animation_after_id = None
+    def _click_reaction(self) -> None:
+        """单击：显示点击反应气泡"""
+        self.app.speech_bubble.show_click_reaction()
 
-            idle_gifs = getattr(app, "idle_gifs", [])
-            if len(idle_gifs) >= 4:
-                # 随机选择 idle3 (index 2) 或 idle4 (index 3)
-                idx = random.choice([2, 3])
-                frames, delays = idle_gifs[idx]
+    def _click_quiet_idle(self) -> None:
+        """安静模式单击：随机播放 idle3 或 idle4 动画，并显示点击反应气泡"""
+        app = self.app
+        # 取消之前的定时器
+        if self._click_animation_after_id:
+            app.root.after_cancel(self._click_animation_after_id)
+            self._click_animation_after_id = None
+
+        click_idle_gifs = self._click_idle_gifs
+        if click_idle_gifs:
+            # 随机选择 idle3 或 idle4（固定两项，取 1 个随机位作为下标）
+            frames, delays = click_idle_gifs[random.getrandbits(1)]
+            # 抽到正在播放的动画时不重置，避免重复配置标签造成闪烁
+            if frames is not app.current_frames:
                 app.current_frames = frames
                 app.current_delays = delays
                 app.frame_index = 0
                 if frames:
-                    app.label.config(image=frames[0])
-
-                # 2000ms 后切换回普通待机动画 (idle2)
-                self._click_animation_after_id = app.root.after(
-                    2000, self._restore_idle_animation
-                )
-            # 安静模式下也触发点击反应气泡
-            app.speech_bubble.show_click_reaction()
-            return
-
-        # 音乐播放模式下显示歌名和音乐控制组件
-        if app._music_playing:
-            if app.music_panel.is_visible():
-                app.music_panel.hide()
-                app.speech_bubble.hide()
-            else:
-                app.music_panel.show()
-                title = app.get_current_music_title()
-                if title:
-                    app.speech_bubble.show(
-                        f"🎵 {title}", duration=None, allow_during_music=True
-                    )
-            return
+                    app.animation.set_label_image(frames[0])
 
+            # 2000ms 后切换回普通待机动画 (idle2)
+            self._click_animation_after_id = app.root.after(
+                2000, self._restore_idle_animation
+            )
         app.speech_bubble.show_click_reaction()
 
+    def _click_show_music(self) -> None:
+        """音乐播放中单击：显示歌名和音乐控制组件"""
+        app = self.app
+        app.music_panel.show()
+        title = app.get_current_music_title()
+        if title:
+            app.speech_bubble.show(
+                f"🎵 {title}", duration=None, allow_during_music=True
+            )
+
+    def _click_hide_music(self) -> None:
+        """音乐播放中单击（控制组件已显示）：隐藏控制组件和气泡"""
+        app = self.app
+        app.music_panel.hide()
+        app.speech_bubble.hide()
+
+    # (安静模式, 音乐播放中, 音乐面板可见) -> 单击处理函数
+    # 音乐播放时无论是否安静模式都只切换音乐控制组件
+    _SINGLE_CLICK_ACTIONS: dict[tuple[bool, bool, bool], Callable] = {
+        (False, False, False): _click_reaction,
+        (True, False, False): _click_quiet_idle,
+        (False, True, False): _click_show_music,
+        (True, True, False): _click_show_music,
+        (False, True, True): _click_hide_music,
+        (True, True, True): _click_hide_music,
+    }
+
     def _handle_double_click(self, event: tk.Event) -> None:
         """处理双击"""
         app = self.app
@@ -138,60 +190,82 @@ class ClickHandler:
         app = self.app
 
         # 确保仍在安静模式
-        if app.behavior_mode != BEHAVIOR_MODE_QUIET:
+        if not app._behavior_is_quiet:
             return
 
-        idle_gifs = getattr(app, "idle_gifs", [])
-        if idle_gifs:
-            # 切换回 idle2 (index 1)
-            frames, delays = idle_gifs[1]
+        rest_idle_gif = self._rest_idle_gif
+        if rest_idle_gif is not None:
+            # 切换回 idle2（已在播放时无需重新配置）
+            frames, delays = rest_idle_gif
+            if frames is app.current_frames:
+                return
             app.current_frames = frames
             app.current_delays = delays
             app.frame_index = 0
             if frames:
-                app.label.config(image=frames[0])
+                app.animation.set_label_image(frames[0])
+
+    def _get_quick_launch(self) -> tuple[bool, str, int]:
+        """读取快速启动配置（按配置版本号缓存，配置被修改后自动刷新）
+
+        Returns:
+            (是否启用, 程序路径, 触发点击次数)
+        """
+        version = get_config_version()
+        if version != self._quick_launch_version:
+            config = get_config_snapshot()
+            self._quick_launch = (
+                bool(config.get("quick_launch_enabled", False)),
+                config.get("quick_launch_exe_path", ""),
+                config.get("quick_launch_click_count", 5),
+            )
+            self._quick_launch_version = get_config_version()
+        return self._quick_launch
 
     def _check_rapid_clicks(self) -> None:
         """检测快速点击次数，触发快速启动"""
-        from src.config import load_config
-
-        config = load_config()
-        if not config.get("quick_launch_enabled", False):
+        enabled, exe_path, click_count = self._get_quick_launch()
+        if not enabled or not exe_path:
             return
 
-        exe_path = config.get("quick_launch_exe_path", "")
-        if not exe_path:
-            return
-
-        if not os.path.exists(exe_path):
-            return
-
-        click_count = config.get("quick_launch_click_count", 5)
-        current_time = time.time() * 1000
-
-        # 清理超出时间窗口的点击记录
-        self._rapid_click_times = [
-            t
-            for t in self._rapid_click_times
-            if current_time - t < self._rapid_click_timeout
-        ]
-
-        # 记录当前点击时间
-        self._rapid_click_times.append(current_time)
-
-        # 检查是否达到点击次数
-        if len(self._rapid_click_times) >= click_count:
-            self._rapid_click_times = []
-            self._launch_exe(exe_path)
+        current_time = time.monotonic_ns()
+
+        # 固定长度的环形缓冲，只保留最近 click_count 次点击
+        click_times = self._rapid_click_times
+        if click_times.maxlen != click_count:
+            click_times = deque(click_times, maxlen=max(1, click_count))
+            self._rapid_click_times = click_times
+        click_times.append(current_time)
+
+        # 最早一次点击仍在时间窗口内，说明窗口内已达到点击次数
+        if (
+            len(click_times) == click_times.maxlen
+            and current_time - click_times[0] < self._rapid_click_timeout
+        ):
+            click_times.clear()
+            # 仅在真正触发时才检查文件是否存在
+            if os.path.exists(exe_path):
+                self._launch_exe(exe_path)
 
     def _launch_exe(self, exe_path: str) -> None:
-        """启动指定的exe程序"""
+        """启动指定的exe程序（在后台线程创建进程，避免阻塞 Tk 主循环）"""
+        threading.Thread(
+            target=self._launch_exe_worker, args=(exe_path,), daemon=True
+        ).start()
+
+    def _launch_exe_worker(self, exe_path: str) -> None:
+        """后台线程：创建进程，结果交回 Tk 主线程显示"""
         try:
             subprocess.Popen(
                 exe_path,
                 cwd=os.path.dirname(exe_path),
                 creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
             )
-            self.app.speech_bubble.show("🚀 已启动程序", duration=2000)
+            message, duration = "🚀 已启动程序", 2000
         except Exception as e:
-            self.app.speech_bubble.show(f"启动失败: {e}", duration=3000)
+            message, duration = f"启动失败: {e}", 3000
+        try:
+            self.app.root.after(0, self.app.speech_bubble.show, message, duration)
+        except RuntimeError:
+            # 主循环已退出
+            pass
@@ -2,19 +2,33 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Callable
 
 import tkinter as tk
 
 if TYPE_CHECKING:
     from src.core.pet_core import DesktopPet
 
+# 拖动中浮动面板跟随刷新的最短间隔（秒，约 60Hz）
+_FOLLOWER_UPDATE_INTERVAL = 0.016
+
 
 class DragHandler:
     """拖动处理器"""
 
     def __init__(self, app: "DesktopPet") -> None:
         self.app = app
+        # 拖动中只保留最新的鼠标位置，每个空闲周期最多移动一次窗口
+        self._latest_pos: tuple[int, int] | None = None
+        self._flush_scheduled = False
+        self._last_follower_update = 0.0
+        # 固定浮动面板的 update_position（面板在 init_state 中创建后不再替换，
+        # 首次拖动时解析一次）
+        self._follower_update_fns: tuple[Callable[[], None], ...] | None = None
+        self._wm_geometry = app.root.wm_geometry
+        # 本次拖动最近一次提交的窗口位置（拖动开始时重置，窗口可能已被移动逻辑挪动）
+        self._last_geom: tuple[int, int] | None = None
 
     def start_drag(self, event: tk.Event) -> None:
         """开始拖动"""
@@ -29,12 +43,23 @@ class DragHandler:
         app._pre_drag_delays = app.current_delays
         app._click_count = 0
         app._drag_started = True
+        self._last_geom = None
+        if self._follower_update_fns is None:
+            self._follower_update_fns = tuple(
+                panel.update_position
+                for panel in (
+                    app.speech_bubble,
+                    app.pomodoro_indicator,
+                    app.music_panel,
+                )
+                if panel is not None
+            )
 
         if app.drag_frames:
             app.current_frames = app.drag_frames
             app.current_delays = [1000] * len(app.drag_frames)
             app.frame_index = 0
-            app.label.config(image=app.current_frames[0])
+            app.animation.set_label_image(app.current_frames[0])
 
     def do_drag(self, event: tk.Event) -> None:
         """拖动中"""
@@ -46,27 +71,59 @@ class DragHandler:
                 self.start_drag(event)
 
         if app.dragging:
-            app.x = event.x_root - app.drag_start_x
-            app.y = event.y_root - app.drag_start_y
-            app.root.geometry(f"+{int(app.x)}+{int(app.y)}")
-            if hasattr(app, "speech_bubble") and app.speech_bubble:
-                app.speech_bubble.update_position()
-            if hasattr(app, "pomodoro_indicator") and app.pomodoro_indicator:
-                app.pomodoro_indicator.update_position()
-            if hasattr(app, "music_panel") and app.music_panel:
-                app.music_panel.update_position()
-            if (
-                hasattr(app, "ai_chat_panel")
-                and app.ai_chat_panel
-                and app.ai_chat_panel.is_visible()
-            ):
-                app.ai_chat_panel._update_position()
+            self._latest_pos = (event.x_root, event.y_root)
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                app.root.after_idle(self._flush_drag)
+
+    def _flush_drag(self) -> None:
+        """按最新鼠标位置移动窗口并同步浮动面板（合并积压的拖动事件）"""
+        self._flush_scheduled = False
+        pos = self._latest_pos
+        if pos is None:
+            return
+        self._latest_pos = None
+
+        app = self.app
+        x = pos[0] - app.drag_start_x
+        y = pos[1] - app.drag_start_y
+        app.x = x
+        app.y = y
+        geom = (x, y)
+        if geom == self._last_geom:
+            return
+        self._last_geom = geom
+        self._wm_geometry("+%d+%d" % geom)
+        # 主窗口每次都移动，浮动面板最多每 16ms 跟随一次
+        now = time.monotonic()
+        if now - self._last_follower_update >= _FOLLOWER_UPDATE_INTERVAL:
+            self._last_follower_update = now
+            self._update_followers()
+
+    def _update_followers(self) -> None:
+        """同步跟随宠物的浮动面板位置"""
+        for update_position in self._follower_update_fns or ():
+            update_position()
+        # AI 聊天面板按需创建/销毁，每次重新读取
+        ai_chat_panel = self.app.ai_chat_panel
+        if ai_chat_panel is not None and ai_chat_panel.is_visible():
+            ai_chat_panel._update_position()
 
     def stop_drag(self, event: tk.Event) -> None:
         """停止拖动"""
         app = self.app
+        # 松开鼠标前的最后一次移动尚未应用时立即应用；之后已调度的空闲刷新
+        # 会因没有待处理位置而直接返回
+        if self._latest_pos is not None:
+            self._flush_drag()
+        self._latest_pos = None
         app.dragging = False
         if app._pre_drag_frames is not None:
             app.current_frames = app._pre_drag_frames
             app.current_delays = app._pre_drag_delays
             app.frame_index = 0
+
+        # 先让窗口几何生效，再按最终位置统一对齐一次浮动面板
+        # （节流期间可能跳过了最后几次跟随）
+        app.root.update_idletasks()
+        self._update_followers()
@@ -10,7 +10,6 @@ from src.platform.system import enable_dpi_awareness
 
 enable_dpi_awareness()
 
-from src.config import load_config
 from src.platform.hotkey import hotkey_manager
 from src.core.pet_core import DesktopPet
 from src.platform.tray import TrayController
@@ -22,9 +21,6 @@ def main():
         root = tk.Tk()
         root.withdraw()  # 先隐藏窗口，避免闪烁
 
-        # 检查是否跳过更新检查
-        config = load_config()
-
         # 创建宠物实例
         app = DesktopPet(root)
 
@@ -0,0 +1,97 @@
+"""MP3 时长读取（只解析文件头，不解码音频数据）"""
+
+from __future__ import annotations
+
+import os
+
+# MPEG Layer III 比特率表（kbps），按 [MPEG1, MPEG2/2.5] 与比特率索引
+_BITRATES = (
+    (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+)
+
+# 采样率表（Hz），按版本位（0=MPEG2.5, 2=MPEG2, 3=MPEG1）与采样率索引
+_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+
+# 在标签之后查找首个音频帧时读取的字节数
+_SCAN_BYTES = 8192
+
+
+def _id3v2_size(header: bytes) -> int:
+    """返回文件开头 ID3v2 标签的总字节数（无标签时为 0）"""
+    if len(header) < 10 or header[:3] != b"ID3":
+        return 0
+    size = 0
+    for byte in header[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    # 带页脚的标签额外 10 字节
+    footer = 10 if header[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def read_mp3_duration(path: str) -> float:
+    """读取 MP3 时长（秒）
+
+    优先使用 Xing/Info 或 VBRI 头中的总帧数（VBR 文件准确），否则按首帧比特率
+    估算（CBR 文件准确）。只读取文件头部几 KB。
+
+    Args:
+        path: MP3 文件路径
+
+    Returns:
+        时长（秒），无法解析时返回 0.0
+    """
+    try:
+        file_size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            audio_start = _id3v2_size(f.read(10))
+            f.seek(audio_start)
+            data = f.read(_SCAN_BYTES)
+            f.seek(max(0, file_size - 128))
+            has_id3v1 = f.read(3) == b"TAG"
+    except OSError:
+        return 0.0
+
+    for i in range(len(data) - 4):
+        if data[i] != 0xFF or data[i + 1] & 0xE0 != 0xE0:
+            continue
+        b1, b2, b3 = data[i + 1], data[i + 2], data[i + 3]
+        version = (b1 >> 3) & 0x03
+        layer = (b1 >> 1) & 0x03
+        bitrate_index = b2 >> 4
+        rate_index = (b2 >> 2) & 0x03
+        # 只处理合法的 Layer III 帧头
+        if version == 1 or layer != 1 or rate_index == 3:
+            continue
+        if bitrate_index in (0, 15):
+            continue
+
+        mpeg1 = version == 3
+        mono = (b3 >> 6) == 3
+        sample_rate = _SAMPLE_RATES[version][rate_index]
+        samples_per_frame = 1152 if mpeg1 else 576
+
+        # Xing/Info 头位于帧头与边信息之后
+        if mpeg1:
+            xing = i + (21 if mono else 36)
+        else:
+            xing = i + (13 if mono else 21)
+        tag = data[xing:xing + 4]
+        if tag in (b"Xing", b"Info"):
+            flags = int.from_bytes(data[xing + 4:xing + 8], "big")
+            if flags & 0x01:
+                frames = int.from_bytes(data[xing + 8:xing + 12], "big")
+                return frames * samples_per_frame / sample_rate
+        elif data[i + 36:i + 40] == b"VBRI":
+            frames = int.from_bytes(data[i + 50:i + 54], "big")
+            return frames * samples_per_frame / sample_rate
+
+        bitrate = _BITRATES[0 if mpeg1 else 1][bitrate_index] * 1000
+        audio_bytes = file_size - audio_start - i - (128 if has_id3v1 else 0)
+        return max(0.0, audio_bytes * 8 / bitrate)
+
+    return 0.0
@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
+import os
+import threading
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pygame
 
+from src.media.mp3_info import read_mp3_duration
 from src.utils import resource_path
 
 if TYPE_CHECKING:
     from src.core.pet_core import DesktopPet
 
+_monotonic = time.monotonic
+
+# 曲目接近结束（或时长未知）时检查播放状态的间隔（毫秒）
+_END_POLL_INTERVAL_MS = 500
+# 距离结束较远时的最长检查间隔（毫秒）：时长按首帧比特率估算时可能偏长
+# （无 Xing/VBRI 头的 VBR 文件、尾部 APE/Lyrics 标签），不能一直睡到估算的结束时刻
+_END_CHECK_MAX_MS = 5000
+
 
 class MusicController:
     """音乐控制器
@@ -22,6 +33,10 @@ class MusicController:
 
     def __init__(self, app: "DesktopPet") -> None:
         self.app = app
+        # 后台预扫描的播放列表（工作线程写入一次，主线程在首次切换播放时取用）
+        self._prefetched_playlist: list[str] | None = None
+        # 曲目路径 -> 显示标题（同一首歌反复点击时不再重复解析文件名）
+        self._title_cache: dict[str, str] = {}
 
     def init_backend(self) -> None:
         """初始化音乐模块"""
@@ -38,7 +53,10 @@ class MusicController:
             return False
 
         if not app._music_playlist:
-            app._music_playlist = self._load_playlist()
+            prefetched = self._prefetched_playlist
+            app._music_playlist = (
+                prefetched if prefetched is not None else self._load_playlist()
+            )
 
         if not app._music_playlist:
             app.speech_bubble.show("未找到音乐文件", duration=3000)
@@ -87,24 +105,23 @@ class MusicController:
         path = self.get_current_path()
         if not path:
             return ""
-        name = Path(path).stem
-        if "-" in name:
-            title = name.split("-", 1)[0].strip()
-            return title or name
-        return name
+        title = self._title_cache.get(path)
+        if title is None:
+            name = Path(path).stem
+            if "-" in name:
+                title = name.split("-", 1)[0].strip() or name
+            else:
+                title = name
+            self._title_cache[path] = title
+        return title
 
     def get_position(self) -> float:
         app = self.app
         if not app._music_playing:
             return 0.0
-        if app._music_paused:
-            pos = (
-                app._music_pause_start - app._music_start_time - app._music_paused_total
-            )
-            return max(0.0, float(pos))
-        now = time.monotonic()
-        pos = now - app._music_start_time - app._music_paused_total
-        return max(0.0, float(pos))
+        # 暂停时位置停在暂停时刻
+        now = app._music_pause_start if app._music_paused else _monotonic()
+        return max(0.0, now - app._music_start_time - app._music_paused_total)
 
     def get_length(self) -> float:
         app = self.app
@@ -113,13 +130,15 @@ class MusicController:
             return 0.0
         if path in app._music_length_cache:
             return app._music_length_cache[path]
-        try:
-            sound = pygame.mixer.Sound(path)
-            length = float(sound.get_length())
-            app._music_length_cache[path] = length
-            return length
-        except pygame.error:
-            return 0.0
+        # 只读文件头获取时长；解析失败时才整首解码
+        length = read_mp3_duration(path)
+        if length <= 0:
+            try:
+                length = float(pygame.mixer.Sound(path).get_length())
+            except pygame.error:
+                return 0.0
+        app._music_length_cache[path] = length
+        return length
 
     def seek(self, seconds: float) -> None:
         app = self.app
@@ -167,7 +186,7 @@ class MusicController:
 
         app.animation.ensure_music_frames()
         app.animation.switch_to_music_animation()
-        app._music_after_id = app.root.after(500, self._check_end)
+        self._schedule_end_check()
         return True
 
     def stop(self) -> None:
@@ -181,6 +200,7 @@ class MusicController:
         except pygame.error as e:
             print(f"停止音乐失败: {e}")
 
+        self._cancel_end_check()
         app._music_playing = False
         app._music_paused = False
         app._music_start_time = 0.0
@@ -188,9 +208,9 @@ class MusicController:
         app._music_paused_total = 0.0
 
         app.animation.restore_animation_after_music()
-        if hasattr(app, "music_panel") and app.music_panel:
+        if app.music_panel is not None:
             app.music_panel.hide()
-        if hasattr(app, "speech_bubble") and app.speech_bubble:
+        if app.speech_bubble is not None:
             app.speech_bubble.hide()
 
     def pause(self) -> None:
@@ -205,6 +225,8 @@ class MusicController:
             return
         app._music_paused = True
         app._music_pause_start = time.monotonic()
+        # 暂停期间不会播放结束，恢复时重新调度
+        self._cancel_end_check()
 
     def resume(self) -> None:
         """恢复音乐"""
@@ -220,15 +242,35 @@ class MusicController:
         app._music_paused_total += max(0.0, float(pause_duration))
         app._music_pause_start = 0.0
         app._music_paused = False
+        self._schedule_end_check()
+
+    def _cancel_end_check(self) -> None:
+        """取消已调度的播放结束检查"""
+        app = self.app
+        after_id = app._after_ids["music"]
+        if after_id is not None:
+            app.root.after_cancel(after_id)
+            app._after_ids["music"] = None
+
+    def _schedule_end_check(self) -> None:
+        """按剩余时长调度播放结束检查
+
+        距离结束较远时每 5 秒检查一次，播放期间不再每 500ms 唤醒；
+        接近结束或时长未知时按 500ms 轮询。时长偏长时最多晚 5 秒切到下一首。
+        """
+        self._cancel_end_check()
+        delay = _END_POLL_INTERVAL_MS
+        remaining = self.get_length() - self.get_position()
+        if remaining > 1.0:
+            delay = min(int((remaining - 0.5) * 1000), _END_CHECK_MAX_MS)
+        app = self.app
+        app._after_ids["music"] = app.root.after(delay, self._check_end)
 
     def _check_end(self) -> None:
         """检查音乐是否播放完毕"""
         app = self.app
-        app._music_after_id = None
-        if not app._music_playing:
-            return
-        if app._music_paused:
-            app._music_after_id = app.root.after(500, self._check_end)
+        app._after_ids["music"] = None
+        if not app._music_playing or app._music_paused:
             return
 
         if not pygame.mixer.music.get_busy():
@@ -241,17 +283,31 @@ class MusicController:
                 app._music_paused_total = 0.0
 
                 # 更新气泡显示（与手动切换保持一致）
-                if hasattr(app, "speech_bubble") and app.speech_bubble.is_visible():
+                if app.speech_bubble is not None and app.speech_bubble.is_visible():
                     title = self.get_current_title()
                     if title:
                         app.speech_bubble.show(
                             f"🎵 {title}", duration=None, allow_during_music=True
                         )
 
-        app._music_after_id = app.root.after(500, self._check_end)
+        self._schedule_end_check()
+
+    def prefetch_playlist(self) -> None:
+        """在后台线程扫描音乐目录，首次切换播放时无需同步扫描"""
+        threading.Thread(target=self._prefetch_playlist_worker, daemon=True).start()
+
+    def _prefetch_playlist_worker(self) -> None:
+        """后台线程：扫描播放列表（不调用 Tk，主循环是否已启动都不影响结果）"""
+        self._prefetched_playlist = self._load_playlist()
 
     def _load_playlist(self) -> list[str]:
-        music_dir = Path(resource_path("assets/music"))
-        if not music_dir.exists():
+        music_dir = resource_path("assets/music")
+        try:
+            with os.scandir(music_dir) as entries:
+                return sorted(
+                    entry.path
+                    for entry in entries
+                    if entry.name.lower().endswith(".mp3") and entry.is_file()
+                )
+        except OSError:
             return []
-        return sorted(str(p) for p in music_dir.glob("*.mp3"))
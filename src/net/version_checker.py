@@ -1,42 +1,125 @@
 """版本检查模块"""
 
+import json
 import re
+import threading
 import tkinter as tk
+import urllib.error
 import urllib.request
 import webbrowser
 from typing import Optional
 
-from src.constants import GITEE_RELEASES_URL
+from src.constants import GITEE_RELEASES_URL, VERSION_CACHE_FILE
 from src.utils import resource_path, version_greater_than
 
+# 发布页中的版本标签链接（页面按时间倒序，首个匹配即最新版本）
+_TAG_PATTERN = re.compile(rb'href="/lzy-buaa-jdi/ameath/releases/tag/(v[^"]+)"')
+
+# 流式读取的块大小，以及跨块保留的尾部长度（避免链接被块边界截断）
+_READ_CHUNK = 8192
+_CHUNK_OVERLAP = 256
+
+# 更新弹窗图标（见 _get_app_icon，需在 Tk 主线程创建）
+_app_icon = None
+
+
+def _load_version_cache() -> dict:
+    """读取上次检查的缓存（ETag/Last-Modified 与版本号）"""
+    try:
+        cache = json.loads(VERSION_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_version_cache(cache: dict) -> None:
+    """保存检查结果缓存"""
+    try:
+        VERSION_CACHE_FILE.write_bytes(json.dumps(cache).encode("utf-8"))
+    except OSError as e:
+        print(f"保存版本缓存失败: {e}")
+
+
+def _search_latest_tag(response) -> Optional[str]:
+    """分块读取响应并查找首个版本标签，找到即停止读取
+
+    Args:
+        response: urlopen 返回的响应对象
+
+    Returns:
+        版本号或 None
+    """
+    buffer = b""
+    while True:
+        chunk = response.read(_READ_CHUNK)
+        if not chunk:
+            return None
+        buffer += chunk
+        match = _TAG_PATTERN.search(buffer)
+        if match:
+            return match.group(1).decode("utf-8")
+        buffer = buffer[-_CHUNK_OVERLAP:]
+
 
 def check_new_version() -> Optional[str]:
     """检查 Gitee 是否有新版本
 
+    携带上次的 ETag/Last-Modified 发起条件请求，页面未变化（304）时直接使用
+    缓存的版本号。
+
     Returns:
         新版本号或 None
     """
+    cache = _load_version_cache()
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    }
+    if cache.get("latest"):
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache.get("last_modified"):
+            headers["If-Modified-Since"] = cache["last_modified"]
+
     try:
-        req = urllib.request.Request(
-            GITEE_RELEASES_URL,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            },
-        )
+        req = urllib.request.Request(GITEE_RELEASES_URL, headers=headers)
         with urllib.request.urlopen(req, timeout=10) as response:
-            html = response.read().decode("utf-8")
-
-        # 提取版本标签
-        pattern = r'href="/lzy-buaa-jdi/ameath/releases/tag/(v[^"]+)"'
-        matches = re.findall(pattern, html)
-        if matches:
-            return matches[0]
+            latest = _search_latest_tag(response)
+            if latest:
+                _save_version_cache(
+                    {
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                        "latest": latest,
+                    }
+                )
+            return latest
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return cache.get("latest")
+        print(f"检查版本失败: {e}")
     except Exception as e:
         print(f"检查版本失败: {e}")
 
     return None
 
 
+def _get_app_icon():
+    """取得 64x64 的应用图标（首次调用时加载 PIL 并解码，之后复用）
+
+    Returns:
+        ImageTk.PhotoImage
+    """
+    global _app_icon
+    if _app_icon is None:
+        from PIL import Image as PILImage
+        from PIL import ImageTk
+
+        with PILImage.open(resource_path("assets/gifs/ameath.gif")) as icon_image:
+            icon_image = icon_image.resize((64, 64), PILImage.Resampling.LANCZOS)
+        _app_icon = ImageTk.PhotoImage(icon_image)
+    return _app_icon
+
+
 def show_update_dialog(
     parent: tk.Tk, current_version: str, latest_version: str
 ) -> None:
@@ -56,13 +139,7 @@ def show_update_dialog(
     dialog.transient(parent)
 
     try:
-        from PIL import Image as PILImage
-        from PIL import ImageTk
-
-        icon_image = PILImage.open(resource_path("assets/gifs/ameath.gif"))
-        icon_image = icon_image.resize((64, 64), PILImage.Resampling.LANCZOS)
-        app_icon = ImageTk.PhotoImage(icon_image)
-        dialog.iconphoto(True, app_icon)
+        dialog.iconphoto(True, _get_app_icon())
     except Exception as e:
         print(f"设置更新窗口图标失败: {e}")
 
@@ -123,12 +200,19 @@ def show_update_dialog(
 
 
 def check_version_and_notify(root: tk.Tk, current_version: str) -> None:
-    """检查版本并通知（后台线程调用）
+    """在后台线程检查版本，有新版本时回到主线程弹窗通知
 
     Args:
         root: 根窗口
         current_version: 当前版本号
     """
+    threading.Thread(
+        target=_check_version_worker, args=(root, current_version), daemon=True
+    ).start()
+
+
+def _check_version_worker(root: tk.Tk, current_version: str) -> None:
+    """后台线程：检查版本并把弹窗交回 Tk 主线程"""
     latest = check_new_version()
     if latest and version_greater_than(latest, current_version):
         # 在主线程显示弹窗
@@ -4,6 +4,7 @@ import ctypes
 from typing import Optional
 
 from src.constants import (
+    GW_HWNDPREV,
     GWL_EXSTYLE,
     HWND_TOPMOST,
     SWP_NOACTIVATE,
@@ -11,6 +12,7 @@ from src.constants import (
     SWP_NOSIZE,
     SWP_SHOWWINDOW,
     WS_EX_LAYERED,
+    WS_EX_TOPMOST,
     WS_EX_TRANSPARENT,
 )
 
@@ -53,6 +55,37 @@ def set_window_topmost(hwnd: int) -> bool:
         return False
 
 
+# 向上检查 Z 序时最多遍历的窗口数，超过则视为已被覆盖
+_ZORDER_SCAN_LIMIT = 64
+
+
+def is_window_front_topmost(hwnd: int) -> bool:
+    """检查窗口是否仍位于置顶层最前（只读查询，不改变 Z 序）
+
+    Args:
+        hwnd: 窗口句柄
+
+    Returns:
+        窗口为置顶且上方没有可见的置顶窗口时返回 True
+    """
+    try:
+        user32 = ctypes.windll.user32
+        if not user32.GetWindowLongW(hwnd, GWL_EXSTYLE) & WS_EX_TOPMOST:
+            return False
+        prev = user32.GetWindow(hwnd, GW_HWNDPREV)
+        for _ in range(_ZORDER_SCAN_LIMIT):
+            if not prev:
+                return True
+            if user32.IsWindowVisible(prev) and (
+                user32.GetWindowLongW(prev, GWL_EXSTYLE) & WS_EX_TOPMOST
+            ):
+                return False
+            prev = user32.GetWindow(prev, GW_HWNDPREV)
+        return False
+    except (AttributeError, OSError, ctypes.WinError):
+        return False
+
+
 def set_click_through(hwnd: int, enable: bool) -> bool:
     """设置鼠标穿透
 
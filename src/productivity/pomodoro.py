@@ -56,24 +56,24 @@ class PomodoroManager:
         self.app._pomodoro_paused = False
         self.app._pomodoro_remaining = 0
         self.app._pomodoro_total = 0
-        if self.app._pomodoro_after_id:
-            self.app.root.after_cancel(self.app._pomodoro_after_id)
-            self.app._pomodoro_after_id = None
+        if self.app._after_ids["pomodoro"]:
+            self.app.root.after_cancel(self.app._after_ids["pomodoro"])
+            self.app._after_ids["pomodoro"] = None
         self.app.pomodoro_indicator.hide()
         self.app.speech_bubble.show("番茄钟已停止", duration=2000)
 
     def _schedule_tick(self) -> None:
         """调度番茄钟计时"""
-        if self.app._pomodoro_after_id:
-            self.app.root.after_cancel(self.app._pomodoro_after_id)
-            self.app._pomodoro_after_id = None
+        if self.app._after_ids["pomodoro"]:
+            self.app.root.after_cancel(self.app._after_ids["pomodoro"])
+            self.app._after_ids["pomodoro"] = None
         if not self.app._pomodoro_enabled or self.app._pomodoro_paused:
             return
-        self.app._pomodoro_after_id = self.app.root.after(1000, self._tick)
+        self.app._after_ids["pomodoro"] = self.app.root.after(1000, self._tick)
 
     def _tick(self) -> None:
         """番茄钟计时回调"""
-        self.app._pomodoro_after_id = None
+        self.app._after_ids["pomodoro"] = None
         if not self.app._pomodoro_enabled or self.app._pomodoro_paused:
             return
         self.app._pomodoro_remaining -= 1
@@ -53,7 +53,7 @@ class SpeechBubble:
             x: X坐标，None则自动计算
             y: Y坐标，None则自动计算
         """
-        if getattr(self.app, "_music_playing", False) and not allow_during_music:
+        if self.app._music_playing and not allow_during_music:
             return
 
         # 如果已有气泡，先关闭